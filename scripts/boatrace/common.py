@@ -1,18 +1,68 @@
 """Shared utility functions for boatrace scripts."""
 
+import re
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
-from boatrace.constants import PLACE_COLS, RATE_COLS
+from boatrace.constants import PLACE_COLS
 
+# Per-boat column names: (boat number, field name).
+_PROGRAM_BOAT_COLUMN = re.compile(r'^([1-6])枠_(.+)$')
+_PREVIEW_BOAT_COLUMN = re.compile(r'^艇([1-6])_(.+)$')
 
+
+@lru_cache(maxsize=1)
 def get_repo_root():
-    """Get the repository root directory."""
+    """Get the repository root directory (resolved once per process)."""
     cwd = Path.cwd()
     return cwd if (cwd / 'data').exists() else cwd.parent
 
 
+@lru_cache(maxsize=32)
+def _split_boat_columns(columns, pattern):
+    """Locate the per-boat columns of a header; cached per distinct header.
+
+    Returns (positions, boat numbers, field names) as arrays, or ``None``
+    when no column matches ``pattern``.
+    """
+    hits = [
+        (i, int(m[1]), m[2])
+        for i, col in enumerate(columns)
+        if isinstance(col, str) and (m := pattern.match(col))
+    ]
+    if not hits:
+        return None
+    positions, boat_nums, fields = zip(*hits)
+    return np.array(positions), np.array(boat_nums), np.array(fields, dtype=object)
+
+
+def _stack_boats(df, id_cols, pattern):
+    """Stack per-boat column groups of a wide DataFrame into one row per boat.
+
+    ``pattern`` is a compiled regex with two groups, (boat number, field
+    name), that is matched against every column name; non-matching columns
+    other than ``id_cols`` are dropped. Rows come out boat-major (every race
+    for boat 1, then boat 2, ...) and the boat number is written to ``艇番``.
+    """
+    split = _split_boat_columns(tuple(df.columns), pattern)
+    if split is None:
+        return pd.DataFrame()
+
+    positions, boat_nums, fields = split
+    id_positions = [df.columns.get_loc(col) for col in id_cols]
+    boat_frames = []
+    for boat_num in np.unique(boat_nums):
+        mask = boat_nums == boat_num
+        tmp = df.iloc[:, [*id_positions, *positions[mask]]]
+        tmp = tmp.set_axis([*id_cols, *fields[mask]], axis=1)
+        tmp['艇番'] = int(boat_num)
+        boat_frames.append(tmp)
+    return pd.concat(boat_frames, ignore_index=True)
+
+
 def reshape_programs(df, include_title=False):
     """Reshape Programs data from wide format (1枠～6枠) to long format.
 
@@ -27,23 +77,9 @@ def reshape_programs(df, include_title=False):
     if include_title:
         race_id_cols = ['レースコード', 'タイトル', 'レース日', 'レース場', 'レース回']
     # Use only columns that exist
-    race_id_cols = [c for c in race_id_cols if c in df.columns]
-    program_frames = []
-
-    for frame_num in range(1, 7):
-        frame_prefix = f'{frame_num}枠_'
-        frame_cols = [col for col in df.columns if col.startswith(frame_prefix)]
-
-        if frame_cols:
-            tmp = df[race_id_cols + frame_cols].copy()
-            rename_map = {col: col[len(frame_prefix):] for col in frame_cols}
-            tmp = tmp.rename(columns=rename_map)
-            tmp['艇番'] = frame_num
-            program_frames.append(tmp)
-
-    if program_frames:
-        return pd.concat(program_frames, ignore_index=True)
-    return pd.DataFrame()
+    columns = set(df.columns)
+    race_id_cols = [c for c in race_id_cols if c in columns]
+    return _stack_boats(df, race_id_cols, _PROGRAM_BOAT_COLUMN)
 
 
 def reshape_previews(df, include_weather=False):
@@ -60,24 +96,10 @@ def reshape_previews(df, include_weather=False):
     weather_cols = ['風速(m)', '風向', '波の高さ(cm)', '天候', '気温(℃)', '水温(℃)']
     base_cols = list(race_id_cols)
     if include_weather:
-        base_cols += [c for c in weather_cols if c in df.columns]
-
-    preview_frames = []
-
-    for boat_num in range(1, 7):
-        boat_prefix = f'艇{boat_num}_'
-        boat_cols = [col for col in df.columns if col.startswith(boat_prefix)]
+        columns = set(df.columns)
+        base_cols += [c for c in weather_cols if c in columns]
 
-        if boat_cols:
-            tmp = df[base_cols + boat_cols].copy()
-            rename_map = {col: col[len(boat_prefix):] for col in boat_cols}
-            tmp = tmp.rename(columns=rename_map)
-            tmp['艇番'] = boat_num
-            preview_frames.append(tmp)
-
-    if preview_frames:
-        return pd.concat(preview_frames, ignore_index=True)
-    return pd.DataFrame()
+    return _stack_boats(df, base_cols, _PREVIEW_BOAT_COLUMN)
 
 
 def reshape_results(df):
@@ -85,51 +107,51 @@ def reshape_results(df):
     if df is None or df.empty:
         return pd.DataFrame()
 
-    result_list = []
-
-    for _, row in df.iterrows():
-        race_code = row['レースコード']
-
-        for place in range(1, 7):
-            boat_col = f'{place}着_艇番'
+    places = {f'{place}着_艇番': place for place in range(1, 7)}
+    boat_cols = [c for c in places if c in df.columns]
+    if not boat_cols:
+        return pd.DataFrame()
 
-            if boat_col in df.columns and pd.notna(row[boat_col]):
-                try:
-                    boat_num = int(row[boat_col])
-                    if 1 <= boat_num <= 6:
-                        result_list.append({
-                            'レースコード': race_code,
-                            '艇番': boat_num,
-                            '着順': place
-                        })
-                except (ValueError, TypeError):
-                    continue
+    long = df[['レースコード'] + boat_cols].reset_index(drop=True).melt(
+        id_vars='レースコード', var_name='着順', value_name='艇番', ignore_index=False
+    )
+    # melt is place-major; restore race order (1着..6着 within each race).
+    long = long.sort_index(kind='stable')
+
+    values = long['艇番']
+    boat_num = pd.to_numeric(values, errors='coerce')
+    if not pd.api.types.is_numeric_dtype(values):
+        # Match int(): text must be an integer literal ("2.0" is skipped).
+        int_text = values.str.fullmatch(r'\s*[+-]?\d+\s*')
+        boat_num = boat_num.where(int_text.fillna(True).astype(bool))
+    long = long[boat_num.notna()]
+    boat_num = boat_num[boat_num.notna()].astype(int)
+    valid = boat_num.between(1, 6)
+    if not valid.any():
+        return pd.DataFrame()
 
-    return pd.DataFrame(result_list) if result_list else pd.DataFrame()
+    return pd.DataFrame({
+        'レースコード': long['レースコード'][valid].to_numpy(),
+        '艇番': boat_num[valid].to_numpy(),
+        '着順': long['着順'][valid].map(places).to_numpy(),
+    })
 
 
 def prepare_features(data, feature_cols):
     """Prepare feature matrix from data with improved NaN handling."""
-    X = pd.DataFrame(index=data.index)
-
+    feature_cols = list(dict.fromkeys(feature_cols))
+    columns = set(data.columns)
+    present = [col for col in feature_cols if col in columns]
+    X = data[present].apply(pd.to_numeric, errors='coerce')
     for col in feature_cols:
-        if col in data.columns:
-            X[col] = pd.to_numeric(data[col], errors='coerce')
-        else:
+        if col not in columns:
             X[col] = 0.0
+    X = X[feature_cols]
+
+    # Place-type columns default to a mid-field 3.5; everything else (rates
+    # included) to its column median, or 0 when the column is all-NaN.
+    fills = {col: 3.5 for col in X.columns if col in PLACE_COLS}
+    medians = X.drop(columns=list(fills)).median()
+    fills.update(medians.fillna(0).to_dict())
 
-    for col in X.columns:
-        if col in PLACE_COLS:
-            X[col] = X[col].fillna(3.5)
-        elif col in RATE_COLS:
-            if X[col].notna().any():
-                X[col] = X[col].fillna(X[col].median())
-            else:
-                X[col] = X[col].fillna(0)
-        else:
-            if X[col].notna().any():
-                X[col] = X[col].fillna(X[col].median())
-            else:
-                X[col] = X[col].fillna(0)
-
-    return X
+    return X.fillna(fills)
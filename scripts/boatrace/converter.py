@@ -1,8 +1,9 @@
 """Convert parsed race data to CSV format."""
 
 import csv
-from io import StringIO
-from typing import List, Optional
+import itertools
+import operator
+from typing import Iterable, Iterator, List, Optional, Sequence
 from .models import (
     MotorHistoryEntry,
     MotorStat,
@@ -80,23 +81,138 @@ VENUE_CODES = {
 }
 
 
+
+class _LineBuffer:
+    """Write-only sink that keeps just the last line ``csv.writer`` emitted."""
+
+    def __init__(self) -> None:
+        self.line = ""
+
+    def write(self, s: str) -> int:
+        self.line = s
+        return len(s)
+
+
+def _plain_csv_line(row: Sequence[str]) -> Optional[str]:
+    """Join ``row`` as a CSV line when no cell needs quoting, else ``None``.
+
+    Almost every cell the converters emit is a number or a short name, so
+    a plain ``",".join`` reproduces ``csv.writer`` output exactly. The
+    comma count catches delimiters inside cells; quote / CR / LF anywhere
+    in the line, non-``str`` cells, or a lone empty cell (which
+    ``csv.writer`` renders as ``""``) fall back to the writer.
+    """
+    try:
+        line = ",".join(row)
+    except TypeError:
+        return None
+    if (
+        len(row) < 2
+        or line.count(",") != len(row) - 1
+        or '"' in line
+        or "\n" in line
+        or "\r" in line
+    ):
+        return None
+    return line + "\n"
+
+
+def iter_csv_text(
+    headers: Sequence[str],
+    rows: Iterable[Sequence[str]],
+) -> Iterator[str]:
+    """Yield a CSV document (header first) one formatted line at a time.
+
+    Only one row is held at a time; ``"".join(iter_csv_text(...))`` builds
+    the document in a single pass without a ``StringIO``. Rows without
+    special characters skip ``csv.writer`` (see :func:`_plain_csv_line`).
+    """
+    buf = _LineBuffer()
+    # Bound once: the loop body runs per row.
+    writerow = csv.writer(buf, lineterminator="\n").writerow
+    plain_line = _plain_csv_line
+    for row in itertools.chain((headers,), rows):
+        line = plain_line(row)
+        if line is None:
+            writerow(row)
+            line = buf.line
+        yield line
+
+
+def _join_csv_lines(file_type: str, lines: Iterable[str]) -> str:
+    """Join CSV ``lines`` into one document and log ``csv_generated``.
+
+    ``rows`` and ``size_bytes`` are tallied per line as the lines are
+    joined, so no CSV-sized encoded copy is ever made; ASCII-only lines
+    (``str.isascii`` is O(1)) are not encoded at all. Skipped entirely
+    when INFO is off.
+    """
+    if not logging_module.is_enabled_for("INFO"):
+        return "".join(lines)
+
+    rows = size_bytes = 0
+
+    def counted() -> Iterator[str]:
+        nonlocal rows, size_bytes
+        for line in lines:
+            rows += 1
+            size_bytes += len(line) if line.isascii() else len(line.encode("utf-8"))
+            yield line
+
+    csv_content = "".join(counted())
+    logging_module.info(
+        "csv_generated",
+        file_type=file_type,
+        rows=rows,
+        size_bytes=size_bytes,
+    )
+    return csv_content
+
+
+# Sort key for per-race items (stadium, then race number); a C-level
+# attrgetter instead of a Python lambda call per item.
+_BY_STADIUM_AND_RACE = operator.attrgetter("stadium_number", "race_number")
+
+
 # CSV Headers for previews (直前情報)
+_PREVIEW_BOAT_FIELDS = (
+    "艇番", "コース", "体重(kg)", "体重調整(kg)", "展示タイム", "チルト調整",
+    "スタート展示",
+)
+
+# Blank cells for a missing boat / measurement slot. Shared immutable
+# tuples: row.extend() copies them, so no per-row padding list is built.
+_PREVIEW_EMPTY_BOAT = ("",) * len(_PREVIEW_BOAT_FIELDS)
+
+# Race-level columns, then boat headers (6 boats, 7 fields each)
 PREVIEWS_HEADERS = [
     "レースコード", "タイトル", "レース日", "レース場", "レース回",
     "風速(m)", "風向", "波の高さ(cm)", "天候", "気温(℃)", "水温(℃)",
+    *(
+        f"艇{boat_num}_{field}"
+        for boat_num in range(1, 7)
+        for field in _PREVIEW_BOAT_FIELDS
+    ),
 ]
 
-# Add boat headers (6 boats, 7 fields each)
-for boat_num in range(1, 7):
-    PREVIEWS_HEADERS.extend([
-        f"艇{boat_num}_艇番",
-        f"艇{boat_num}_コース",
-        f"艇{boat_num}_体重(kg)",
-        f"艇{boat_num}_体重調整(kg)",
-        f"艇{boat_num}_展示タイム",
-        f"艇{boat_num}_チルト調整",
-        f"艇{boat_num}_スタート展示",
-    ])
+
+# Field order matches the race-level / per-boat PREVIEWS_HEADERS columns.
+_PREVIEW_WEATHER_ATTRS = operator.attrgetter(
+    "wind_speed",
+    "wind_direction",
+    "wave_height",
+    "weather",
+    "air_temperature",
+    "water_temperature",
+)
+_PREVIEW_BOAT_ATTRS = operator.attrgetter(
+    "course_number",
+    "weight",
+    "weight_adjustment",
+    "exhibition_time",
+    "tilt_adjustment",
+    "start_timing",
+)
 
 
 def race_preview_to_row(preview: RacePreview) -> List[str]:
@@ -116,30 +232,20 @@ def race_preview_to_row(preview: RacePreview) -> List[str]:
         preview.date,                           # レース日
         preview.stadium,                        # レース場
         preview.race_round,                     # レース回
-        str(preview.wind_speed) if preview.wind_speed is not None else "",  # 風速(m)
-        str(preview.wind_direction) if preview.wind_direction is not None else "",  # 風向
-        str(preview.wave_height) if preview.wave_height is not None else "",  # 波の高さ(cm)
-        str(preview.weather) if preview.weather is not None else "",  # 天候
-        str(preview.air_temperature) if preview.air_temperature is not None else "",  # 気温(℃)
-        str(preview.water_temperature) if preview.water_temperature is not None else "",  # 水温(℃)
     ]
+    # 風速(m) / 風向 / 波の高さ(cm) / 天候 / 気温(℃) / 水温(℃)
+    row.extend(_fmt_cells(_PREVIEW_WEATHER_ATTRS(preview)))
 
     # Add boat data (pad with empty boats if fewer than 6)
-    boats = preview.boats + [None] * (6 - len(preview.boats))
-
-    for boat in boats[:6]:
+    boats = preview.boats[:6]
+    for boat in boats:
         if boat:
-            row.extend([
-                str(boat.boat_number) if boat.boat_number else "",  # 艇番
-                str(boat.course_number) if boat.course_number is not None else "",  # コース
-                str(boat.weight) if boat.weight is not None else "",  # 体重(kg)
-                str(boat.weight_adjustment) if boat.weight_adjustment is not None else "",  # 体重調整(kg)
-                str(boat.exhibition_time) if boat.exhibition_time is not None else "",  # 展示タイム
-                str(boat.tilt_adjustment) if boat.tilt_adjustment is not None else "",  # チルト調整
-                str(boat.start_timing) if boat.start_timing is not None else "",  # スタート展示
-            ])
+            row.append(str(boat.boat_number) if boat.boat_number else "")  # 艇番
+            # コース / 体重(kg) / 体重調整(kg) / 展示タイム / チルト調整 / スタート展示
+            row.extend(_fmt_cells(_PREVIEW_BOAT_ATTRS(boat)))
         else:
-            row.extend([""] * 7)
+            row.extend(_PREVIEW_EMPTY_BOAT)
+    row.extend(_PREVIEW_EMPTY_BOAT * (6 - len(boats)))
 
     return row
 
@@ -154,25 +260,9 @@ def previews_to_csv(previews: List[RacePreview]) -> str:
         CSV content as string
     """
     try:
-        output = StringIO()
-        writer = csv.writer(output, lineterminator="\n")
-
-        # Write header
-        writer.writerow(PREVIEWS_HEADERS)
-
-        # Write data rows
-        for preview in previews:
-            row = race_preview_to_row(preview)
-            writer.writerow(row)
-
-        csv_content = output.getvalue()
-        output.close()
-
-        logging_module.info(
-            "csv_generated",
-            file_type="previews",
-            rows=len(previews) + 1,  # +1 for header
-            size_bytes=len(csv_content.encode("utf-8")),
+        csv_content = _join_csv_lines(
+            "previews",
+            iter_csv_text(PREVIEWS_HEADERS, map(race_preview_to_row, previews)),
         )
 
         return csv_content
@@ -209,16 +299,15 @@ ORIGINAL_EXHIBITION_HEADERS: List[str] = [
     "計測項目1",
     "計測項目2",
     "計測項目3",
+    *(
+        f"艇{boat_num}_{field}"
+        for boat_num in range(1, 7)
+        for field in ("選手名", "値1", "値2", "値3")
+    ),
 ]
-for _boat_num in range(1, 7):
-    ORIGINAL_EXHIBITION_HEADERS.extend(
-        [
-            f"艇{_boat_num}_選手名",
-            f"艇{_boat_num}_値1",
-            f"艇{_boat_num}_値2",
-            f"艇{_boat_num}_値3",
-        ]
-    )
+
+
+_ORIGINAL_EXHIBITION_EMPTY_BOAT = ("", "", "", "")
 
 
 def _fmt_optional(value) -> str:
@@ -228,6 +317,33 @@ def _fmt_optional(value) -> str:
     return str(value)
 
 
+def _fmt_cells(values: Iterable) -> List[str]:
+    """Format a run of optional values for CSV: None -> ''.
+
+    Same as mapping :func:`_fmt_optional` over ``values``, but the branch
+    is inlined in the comprehension, so there is one Python call per
+    object instead of one per cell.
+    """
+    return ["" if v is None else str(v) for v in values]
+
+
+# Pre-rendered "00".."99" cells for stadium / race numbers (01-24 / 01-12
+# in practice). An f-string with a format spec costs several times a tuple
+# index, and these run for every race row.
+_TWO_DIGIT = tuple(f"{n:02d}" for n in range(100))
+_RACE_LABEL = tuple(f"{n:02d}R" for n in range(100))
+
+
+def _two_digit(n: int) -> str:
+    """Format ``n`` as ``f"{n:02d}"`` (table lookup for 0-99)."""
+    return _TWO_DIGIT[n] if 0 <= n < 100 else f"{n:02d}"
+
+
+def _race_label(n: int) -> str:
+    """Format ``n`` as ``f"{n:02d}R"`` (table lookup for 0-99)."""
+    return _RACE_LABEL[n] if 0 <= n < 100 else f"{n:02d}R"
+
+
 def original_exhibition_to_row(data: OriginalExhibitionData) -> List[str]:
     """Convert a single OriginalExhibitionData to a CSV row.
 
@@ -236,12 +352,12 @@ def original_exhibition_to_row(data: OriginalExhibitionData) -> List[str]:
     CSVs whose ``レース場コード`` column uses the same format. This
     enables straight string equality joins across files.
     """
-    labels = list(data.measure_labels) + [""] * 3
+    labels = (*data.measure_labels[:3], "", "", "")
     row: List[str] = [
         data.race_code,
         data.date,
-        f"{data.stadium_number:02d}",
-        f"{data.race_number:02d}R",
+        _two_digit(data.stadium_number),
+        _race_label(data.race_number),
         _fmt_optional(data.status),
         _fmt_optional(data.measure_count),
         labels[0],
@@ -254,16 +370,10 @@ def original_exhibition_to_row(data: OriginalExhibitionData) -> List[str]:
     for boat_num in range(1, 7):
         boat = boats_by_number.get(boat_num)
         if boat is None:
-            row.extend(["", "", "", ""])
+            row.extend(_ORIGINAL_EXHIBITION_EMPTY_BOAT)
             continue
-        row.extend(
-            [
-                boat.racer_name or "",
-                _fmt_optional(boat.value1),
-                _fmt_optional(boat.value2),
-                _fmt_optional(boat.value3),
-            ]
-        )
+        row.append(boat.racer_name or "")
+        row.extend(_fmt_cells((boat.value1, boat.value2, boat.value3)))
 
     return row
 
@@ -280,26 +390,14 @@ def original_exhibition_to_csv(
         CSV content as string (header + rows). Returns "" on failure.
     """
     try:
-        output = StringIO()
-        writer = csv.writer(output, lineterminator="\n")
-
-        writer.writerow(ORIGINAL_EXHIBITION_HEADERS)
-
         # Stable sort: by stadium then race number.
-        ordered = sorted(
-            items, key=lambda d: (d.stadium_number, d.race_number)
-        )
-        for item in ordered:
-            writer.writerow(original_exhibition_to_row(item))
-
-        csv_content = output.getvalue()
-        output.close()
-
-        logging_module.info(
-            "csv_generated",
-            file_type="original_exhibition",
-            rows=len(ordered) + 1,
-            size_bytes=len(csv_content.encode("utf-8")),
+        ordered = sorted(items, key=_BY_STADIUM_AND_RACE)
+        csv_content = _join_csv_lines(
+            "original_exhibition",
+            iter_csv_text(
+                ORIGINAL_EXHIBITION_HEADERS,
+                map(original_exhibition_to_row, ordered),
+            ),
         )
 
         return csv_content
@@ -323,13 +421,6 @@ def original_exhibition_to_csv(
 # The session slots are emitted in source order (col[25]..col[38] of bc_j_str3),
 # i.e. day1-race1, day1-race2, day2-race1, ..., day7-race2.
 
-RACE_CARD_HEADERS: List[str] = [
-    "レースコード",
-    "レース日",
-    "レース場コード",
-    "レース回",
-]
-
 # Per-boat profile columns. Order matches RaceCardBoat field declaration.
 _RACE_CARD_BOAT_PROFILE_FIELDS: List[str] = [
     "登録番号",
@@ -369,76 +460,100 @@ _RACE_CARD_SESSION_FIELDS: List[str] = [
     "着順",
 ]
 
-for _boat_num in range(1, 7):
-    for _profile_field in _RACE_CARD_BOAT_PROFILE_FIELDS:
-        RACE_CARD_HEADERS.append(f"艇{_boat_num}_{_profile_field}")
-    # 14 slots: indexed by (day, race_in_day). Column naming follows
-    # ``艇N_節D{D}走{S}_*`` so day=1..7, race_in_day=1..2.
-    for _day in range(1, 8):
-        for _race_in_day in range(1, 3):
-            for _session_field in _RACE_CARD_SESSION_FIELDS:
-                RACE_CARD_HEADERS.append(
-                    f"艇{_boat_num}_節D{_day}走{_race_in_day}_{_session_field}"
-                )
+# 14 session slots per boat, indexed by (day, race_in_day). Column naming
+# follows ``艇N_節D{D}走{S}_*`` so day=1..7, race_in_day=1..2.
+RACE_CARD_HEADERS: List[str] = [
+    "レースコード",
+    "レース日",
+    "レース場コード",
+    "レース回",
+    *(
+        header
+        for boat_num in range(1, 7)
+        for header in (
+            *(f"艇{boat_num}_{field}" for field in _RACE_CARD_BOAT_PROFILE_FIELDS),
+            *(
+                f"艇{boat_num}_節D{day}走{race_in_day}_{field}"
+                for day in range(1, 8)
+                for race_in_day in range(1, 3)
+                for field in _RACE_CARD_SESSION_FIELDS
+            ),
+        )
+    ),
+]
+
 
+# Attribute getters in column order (_RACE_CARD_SESSION_FIELDS /
+# _RACE_CARD_BOAT_PROFILE_FIELDS): one C-level call per object instead of
+# one attribute lookup per cell.
+_RACE_CARD_SESSION_ATTRS = operator.attrgetter(
+    "race_number",
+    "entry_course",
+    "waku",
+    "start_timing",
+    "finish_position",
+)
+_RACE_CARD_BOAT_ATTRS = operator.attrgetter(
+    "registration_number",
+    "racer_name",
+    "period",
+    "branch",
+    "birthplace",
+    "age",
+    "grade",
+    "prize_excluded",
+    "f_count",
+    "l_count",
+    "national_avg_st",
+    "national_win_rate",
+    "national_double_rate",
+    "national_triple_rate",
+    "local_win_rate",
+    "local_double_rate",
+    "local_triple_rate",
+    "motor_flag",
+    "motor_number",
+    "motor_double_rate",
+    "motor_triple_rate",
+    "boat_flag",
+    "boat_id",
+    "boat_double_rate",
+    "boat_triple_rate",
+    "hayami",
+)
+
+
+_RACE_CARD_EMPTY_SESSION = ("",) * len(_RACE_CARD_SESSION_FIELDS)
+_RACE_CARD_EMPTY_BOAT = ("",) * (
+    len(_RACE_CARD_BOAT_PROFILE_FIELDS) + 14 * len(_RACE_CARD_SESSION_FIELDS)
+)
 
-def _race_card_session_cells(session: Optional[RaceCardSession]) -> List[str]:
+
+def _race_card_session_cells(session: Optional[RaceCardSession]) -> Sequence[str]:
     """Render a single session quintuple as 5 CSV cells. Empty session -> 5 blanks."""
     if session is None:
-        return ["", "", "", "", ""]
-    return [
-        _fmt_optional(session.race_number),
-        _fmt_optional(session.entry_course),
-        _fmt_optional(session.waku),
-        _fmt_optional(session.start_timing),
-        _fmt_optional(session.finish_position),
-    ]
+        return _RACE_CARD_EMPTY_SESSION
+    return _fmt_cells(_RACE_CARD_SESSION_ATTRS(session))
 
 
-def _race_card_boat_cells(boat: Optional[RaceCardBoat]) -> List[str]:
-    """Render a single boat (profile + 14 sessions) as 96 CSV cells.
+def _extend_race_card_boat(row: List[str], boat: Optional[RaceCardBoat]) -> None:
+    """Append a single boat (profile + 14 sessions) to ``row`` as 96 CSV cells.
 
-    Missing boat (欠場 / not held) -> 96 blanks.
+    Missing boat (欠場 / not held) -> 96 blanks. Cells go straight into the
+    row rather than through a per-boat list.
     """
     if boat is None:
-        return [""] * (len(_RACE_CARD_BOAT_PROFILE_FIELDS) + 14 * len(_RACE_CARD_SESSION_FIELDS))
-
-    cells: List[str] = [
-        _fmt_optional(boat.registration_number),
-        boat.racer_name or "",
-        boat.period or "",
-        boat.branch or "",
-        boat.birthplace or "",
-        _fmt_optional(boat.age),
-        boat.grade or "",
-        boat.prize_excluded or "",
-        _fmt_optional(boat.f_count),
-        _fmt_optional(boat.l_count),
-        _fmt_optional(boat.national_avg_st),
-        _fmt_optional(boat.national_win_rate),
-        _fmt_optional(boat.national_double_rate),
-        _fmt_optional(boat.national_triple_rate),
-        _fmt_optional(boat.local_win_rate),
-        _fmt_optional(boat.local_double_rate),
-        _fmt_optional(boat.local_triple_rate),
-        _fmt_optional(boat.motor_flag),
-        _fmt_optional(boat.motor_number),
-        _fmt_optional(boat.motor_double_rate),
-        _fmt_optional(boat.motor_triple_rate),
-        _fmt_optional(boat.boat_flag),
-        _fmt_optional(boat.boat_id),
-        _fmt_optional(boat.boat_double_rate),
-        _fmt_optional(boat.boat_triple_rate),
-        _fmt_optional(boat.hayami),
-    ]
+        row.extend(_RACE_CARD_EMPTY_BOAT)
+        return
+
+    row.extend(_fmt_cells(_RACE_CARD_BOAT_ATTRS(boat)))
 
     # Always emit 14 session slots; pad with empty sessions if the source
     # gave fewer (defensive — RaceCardScraper always produces 14).
-    sessions = list(boat.sessions) + [None] * (14 - len(boat.sessions))
-    for slot in sessions[:14]:
-        cells.extend(_race_card_session_cells(slot))
-
-    return cells
+    sessions = boat.sessions[:14]
+    for slot in sessions:
+        row.extend(_race_card_session_cells(slot))
+    row.extend(_RACE_CARD_EMPTY_SESSION * (14 - len(sessions)))
 
 
 def race_card_to_row(card: RaceCard) -> List[str]:
@@ -446,13 +561,13 @@ def race_card_to_row(card: RaceCard) -> List[str]:
     row: List[str] = [
         card.race_code,
         card.date,
-        f"{card.stadium_number:02d}",
-        f"{card.race_number:02d}R",
+        _two_digit(card.stadium_number),
+        _race_label(card.race_number),
     ]
 
     boats_by_number = {b.boat_number: b for b in card.boats}
     for boat_num in range(1, 7):
-        row.extend(_race_card_boat_cells(boats_by_number.get(boat_num)))
+        _extend_race_card_boat(row, boats_by_number.get(boat_num))
 
     return row
 
@@ -463,22 +578,10 @@ def race_cards_to_csv(items: List[RaceCard]) -> str:
     Returns ``""`` on failure.
     """
     try:
-        output = StringIO()
-        writer = csv.writer(output, lineterminator="\n")
-        writer.writerow(RACE_CARD_HEADERS)
-
-        ordered = sorted(items, key=lambda c: (c.stadium_number, c.race_number))
-        for item in ordered:
-            writer.writerow(race_card_to_row(item))
-
-        csv_content = output.getvalue()
-        output.close()
-
-        logging_module.info(
-            "csv_generated",
-            file_type="race_cards",
-            rows=len(ordered) + 1,
-            size_bytes=len(csv_content.encode("utf-8")),
+        ordered = sorted(items, key=_BY_STADIUM_AND_RACE)
+        csv_content = _join_csv_lines(
+            "race_cards",
+            iter_csv_text(RACE_CARD_HEADERS, map(race_card_to_row, ordered)),
         )
         return csv_content
 
@@ -500,13 +603,6 @@ def race_cards_to_csv(items: List[RaceCard]) -> str:
 # (4 summary + 10 runs x 3 sub-columns) = 4 + 6 x 34 = 208 columns.
 # Runs are newest-first: 過去1走 = 前走, 過去10走 = 10走前.
 
-WAKU10_HEADERS: List[str] = [
-    "レースコード",
-    "レース日",
-    "レース場コード",
-    "レース回",
-]
-
 _WAKU10_SUMMARY_FIELDS: List[str] = [
     "選手名",
     "枠番別勝率",
@@ -520,43 +616,55 @@ _WAKU10_RUN_FIELDS: List[str] = [
     "グレード",
 ]
 
-for _boat_num in range(1, 7):
-    for _summary_field in _WAKU10_SUMMARY_FIELDS:
-        WAKU10_HEADERS.append(f"艇{_boat_num}_{_summary_field}")
-    for _run_idx in range(1, 11):  # 過去1走 (前走) .. 過去10走
-        for _run_field in _WAKU10_RUN_FIELDS:
-            WAKU10_HEADERS.append(
-                f"艇{_boat_num}_過去{_run_idx}走_{_run_field}"
-            )
+WAKU10_HEADERS: List[str] = [
+    "レースコード",
+    "レース日",
+    "レース場コード",
+    "レース回",
+    *(
+        header
+        for boat_num in range(1, 7)
+        for header in (
+            *(f"艇{boat_num}_{field}" for field in _WAKU10_SUMMARY_FIELDS),
+            *(
+                f"艇{boat_num}_過去{run_idx}走_{field}"
+                for run_idx in range(1, 11)  # 過去1走 (前走) .. 過去10走
+                for field in _WAKU10_RUN_FIELDS
+            ),
+        )
+    ),
+]
+
+
+_WAKU10_RUN_ATTRS = operator.attrgetter("finish_position", "entry_course", "grade")
+_WAKU10_BOAT_ATTRS = operator.attrgetter(
+    "racer_name", "win_rate", "avg_st", "avg_start_order"
+)
+
+
+_WAKU10_EMPTY_RUN = ("",) * len(_WAKU10_RUN_FIELDS)
+_WAKU10_EMPTY_BOAT = ("",) * (
+    len(_WAKU10_SUMMARY_FIELDS) + 10 * len(_WAKU10_RUN_FIELDS)
+)
 
 
-def _waku10_run_cells(run: Optional[Waku10Run]) -> List[str]:
+def _waku10_run_cells(run: Optional[Waku10Run]) -> Sequence[str]:
     """Render one run as 3 CSV cells. Empty run -> 3 blanks."""
     if run is None:
-        return ["", "", ""]
-    return [
-        _fmt_optional(run.finish_position),
-        _fmt_optional(run.entry_course),
-        _fmt_optional(run.grade),
-    ]
+        return _WAKU10_EMPTY_RUN
+    return _fmt_cells(_WAKU10_RUN_ATTRS(run))
 
 
-def _waku10_boat_cells(boat: Optional[Waku10Boat]) -> List[str]:
-    """Render one boat (summary + 10 runs) as 34 CSV cells."""
+def _extend_waku10_boat(row: List[str], boat: Optional[Waku10Boat]) -> None:
+    """Append one boat (summary + 10 runs) to ``row`` as 34 CSV cells."""
     if boat is None:
-        return [""] * (
-            len(_WAKU10_SUMMARY_FIELDS) + 10 * len(_WAKU10_RUN_FIELDS)
-        )
-    cells: List[str] = [
-        boat.racer_name or "",
-        _fmt_optional(boat.win_rate),
-        _fmt_optional(boat.avg_st),
-        _fmt_optional(boat.avg_start_order),
-    ]
-    runs = list(boat.runs) + [None] * (10 - len(boat.runs))
-    for run in runs[:10]:
-        cells.extend(_waku10_run_cells(run))
-    return cells
+        row.extend(_WAKU10_EMPTY_BOAT)
+        return
+    row.extend(_fmt_cells(_WAKU10_BOAT_ATTRS(boat)))
+    runs = boat.runs[:10]
+    for run in runs:
+        row.extend(_waku10_run_cells(run))
+    row.extend(_WAKU10_EMPTY_RUN * (10 - len(runs)))
 
 
 def waku10_to_row(card: Waku10Card) -> List[str]:
@@ -564,34 +672,22 @@ def waku10_to_row(card: Waku10Card) -> List[str]:
     row: List[str] = [
         card.race_code,
         card.date,
-        f"{card.stadium_number:02d}",
-        f"{card.race_number:02d}R",
+        _two_digit(card.stadium_number),
+        _race_label(card.race_number),
     ]
     boats_by_number = {b.boat_number: b for b in card.boats}
     for boat_num in range(1, 7):
-        row.extend(_waku10_boat_cells(boats_by_number.get(boat_num)))
+        _extend_waku10_boat(row, boats_by_number.get(boat_num))
     return row
 
 
 def waku10_to_csv(items: List[Waku10Card]) -> str:
     """Serialise a list of :class:`Waku10Card` to CSV content."""
     try:
-        output = StringIO()
-        writer = csv.writer(output, lineterminator="\n")
-        writer.writerow(WAKU10_HEADERS)
-
-        ordered = sorted(items, key=lambda c: (c.stadium_number, c.race_number))
-        for item in ordered:
-            writer.writerow(waku10_to_row(item))
-
-        csv_content = output.getvalue()
-        output.close()
-
-        logging_module.info(
-            "csv_generated",
-            file_type="waku10",
-            rows=len(ordered) + 1,
-            size_bytes=len(csv_content.encode("utf-8")),
+        ordered = sorted(items, key=_BY_STADIUM_AND_RACE)
+        csv_content = _join_csv_lines(
+            "waku10",
+            iter_csv_text(WAKU10_HEADERS, map(waku10_to_row, ordered)),
         )
         return csv_content
 
@@ -622,39 +718,27 @@ MONTHLY_SCHEDULE_HEADERS: List[str] = [
 ]
 
 
+_SCHEDULE_ENTRY_ATTRS = operator.attrgetter(
+    "stadium_code", "start_date", "end_date", "grade", "title", "races"
+)
+
+
 def schedule_entry_to_row(entry: ScheduleEntry) -> List[str]:
     """Convert a single :class:`ScheduleEntry` to a CSV row (6 cells)."""
-    return [
-        entry.stadium_code,
-        _fmt_optional(entry.start_date),
-        _fmt_optional(entry.end_date),
-        _fmt_optional(entry.grade),
-        _fmt_optional(entry.title),
-        _fmt_optional(entry.races),
-    ]
+    return _fmt_cells(_SCHEDULE_ENTRY_ATTRS(entry))
 
 
 def monthly_schedule_to_csv(items: List[ScheduleEntry]) -> str:
     """Serialise a list of :class:`ScheduleEntry` to CSV content."""
     try:
-        output = StringIO()
-        writer = csv.writer(output, lineterminator="\n")
-        writer.writerow(MONTHLY_SCHEDULE_HEADERS)
-
         ordered = sorted(
             items, key=lambda e: (e.stadium_code, e.start_date or "")
         )
-        for item in ordered:
-            writer.writerow(schedule_entry_to_row(item))
-
-        csv_content = output.getvalue()
-        output.close()
-
-        logging_module.info(
-            "csv_generated",
-            file_type="monthly_schedule",
-            rows=len(ordered) + 1,
-            size_bytes=len(csv_content.encode("utf-8")),
+        csv_content = _join_csv_lines(
+            "monthly_schedule",
+            iter_csv_text(
+                MONTHLY_SCHEDULE_HEADERS, map(schedule_entry_to_row, ordered)
+            ),
         )
         return csv_content
 
@@ -678,13 +762,6 @@ def monthly_schedule_to_csv(items: List[ScheduleEntry]) -> str:
 # only the underlying data source differs, so a single converter serves
 # both files.
 
-RECENT_FORM_HEADERS: List[str] = [
-    "レースコード",
-    "レース日",
-    "レース場コード",
-    "レース回",
-]
-
 _RECENT_FORM_IDENTITY_FIELDS: List[str] = ["登録番号", "選手名"]
 
 # Per-session sub-columns (in source order).
@@ -697,48 +774,64 @@ _RECENT_FORM_SESSION_FIELDS: List[str] = [
     "着順列",
 ]
 
-for _boat_num in range(1, 7):
-    for _identity_field in _RECENT_FORM_IDENTITY_FIELDS:
-        RECENT_FORM_HEADERS.append(f"艇{_boat_num}_{_identity_field}")
-    for _session_idx in range(1, 6):  # 前1節..前5節
-        for _session_field in _RECENT_FORM_SESSION_FIELDS:
-            RECENT_FORM_HEADERS.append(
-                f"艇{_boat_num}_前{_session_idx}節_{_session_field}"
-            )
+RECENT_FORM_HEADERS: List[str] = [
+    "レースコード",
+    "レース日",
+    "レース場コード",
+    "レース回",
+    *(
+        header
+        for boat_num in range(1, 7)
+        for header in (
+            *(f"艇{boat_num}_{field}" for field in _RECENT_FORM_IDENTITY_FIELDS),
+            *(
+                f"艇{boat_num}_前{session_idx}節_{field}"
+                for session_idx in range(1, 6)  # 前1節..前5節
+                for field in _RECENT_FORM_SESSION_FIELDS
+            ),
+        )
+    ),
+]
+
+
+_RECENT_FORM_SESSION_ATTRS = operator.attrgetter(
+    "start_date",
+    "end_date",
+    "stadium_code",
+    "stadium_name",
+    "grade",
+    "finish_sequence",
+)
+
+
+_RECENT_FORM_EMPTY_SESSION = ("",) * len(_RECENT_FORM_SESSION_FIELDS)
+_RECENT_FORM_EMPTY_BOAT = ("",) * (
+    len(_RECENT_FORM_IDENTITY_FIELDS) + 5 * len(_RECENT_FORM_SESSION_FIELDS)
+)
 
 
-def _recent_form_session_cells(session: Optional[RecentFormSession]) -> List[str]:
+def _recent_form_session_cells(session: Optional[RecentFormSession]) -> Sequence[str]:
     """Render one session as 6 CSV cells. Empty session -> 6 blanks."""
     if session is None:
-        return ["", "", "", "", "", ""]
-    return [
-        session.start_date or "",
-        session.end_date or "",
-        session.stadium_code or "",
-        session.stadium_name or "",
-        session.grade or "",
-        session.finish_sequence or "",
-    ]
+        return _RECENT_FORM_EMPTY_SESSION
+    return _fmt_cells(_RECENT_FORM_SESSION_ATTRS(session))
 
 
-def _recent_form_boat_cells(boat: Optional[RecentFormBoat]) -> List[str]:
-    """Render one boat (identity + 5 sessions) as 32 CSV cells.
+def _extend_recent_form_boat(row: List[str], boat: Optional[RecentFormBoat]) -> None:
+    """Append one boat (identity + 5 sessions) to ``row`` as 32 CSV cells.
 
     Missing boat -> 32 blanks. Missing trailing sessions are padded.
     """
     if boat is None:
-        return [""] * (
-            len(_RECENT_FORM_IDENTITY_FIELDS) + 5 * len(_RECENT_FORM_SESSION_FIELDS)
-        )
+        row.extend(_RECENT_FORM_EMPTY_BOAT)
+        return
 
-    cells: List[str] = [
-        _fmt_optional(boat.registration_number),
-        boat.racer_name or "",
-    ]
-    sessions = list(boat.sessions) + [None] * (5 - len(boat.sessions))
-    for slot in sessions[:5]:
-        cells.extend(_recent_form_session_cells(slot))
-    return cells
+    row.append(_fmt_optional(boat.registration_number))
+    row.append(boat.racer_name or "")
+    sessions = boat.sessions[:5]
+    for slot in sessions:
+        row.extend(_recent_form_session_cells(slot))
+    row.extend(_RECENT_FORM_EMPTY_SESSION * (5 - len(sessions)))
 
 
 def recent_form_to_row(form: RecentForm) -> List[str]:
@@ -746,12 +839,12 @@ def recent_form_to_row(form: RecentForm) -> List[str]:
     row: List[str] = [
         form.race_code,
         form.date,
-        f"{form.stadium_number:02d}",
-        f"{form.race_number:02d}R",
+        _two_digit(form.stadium_number),
+        _race_label(form.race_number),
     ]
     boats_by_number = {b.boat_number: b for b in form.boats}
     for boat_num in range(1, 7):
-        row.extend(_recent_form_boat_cells(boats_by_number.get(boat_num)))
+        _extend_recent_form_boat(row, boats_by_number.get(boat_num))
     return row
 
 
@@ -762,22 +855,10 @@ def recent_forms_to_csv(items: List[RecentForm], variant: str = "national") -> s
     schema (national and local share the exact same column layout).
     """
     try:
-        output = StringIO()
-        writer = csv.writer(output, lineterminator="\n")
-        writer.writerow(RECENT_FORM_HEADERS)
-
-        ordered = sorted(items, key=lambda f: (f.stadium_number, f.race_number))
-        for item in ordered:
-            writer.writerow(recent_form_to_row(item))
-
-        csv_content = output.getvalue()
-        output.close()
-
-        logging_module.info(
-            "csv_generated",
-            file_type=f"recent_form_{variant}",
-            rows=len(ordered) + 1,
-            size_bytes=len(csv_content.encode("utf-8")),
+        ordered = sorted(items, key=_BY_STADIUM_AND_RACE)
+        csv_content = _join_csv_lines(
+            f"recent_form_{variant}",
+            iter_csv_text(RECENT_FORM_HEADERS, map(recent_form_to_row, ordered)),
         )
         return csv_content
 
@@ -837,44 +918,47 @@ MOTOR_STATS_HEADERS: List[str] = [
 ]
 
 
+_MOTOR_STAT_ATTRS = operator.attrgetter(
+    "record_date",
+    "motor_period_start",
+    "stadium_code",
+    "motor_number",
+    "win_rate",
+    "win_rate_rank",
+    "double_rate",
+    "double_rate_rank",
+    "triple_rate",
+    "triple_rate_rank",
+    "first_count",
+    "first_rank",
+    "second_count",
+    "second_rank",
+    "third_count",
+    "third_rank",
+    "out_of_place_count",
+    "start_count",
+    "championship_count",
+    "championship_rank",
+    "final_count",
+    "final_rank",
+    "raw_col_21",
+    "raw_col_22",
+    "avg_lap_seconds",
+    "avg_lap_rank",
+    "first_use_date",
+    "maintenance_type1_count",
+    "maintenance_type2_count",
+    "maintenance_type3_count",
+    "maintenance_type4_count",
+    "maintenance_type5_count",
+    "maintenance_type6_count",
+    "last_maintenance_date",
+)
+
+
 def motor_stat_to_row(stat: MotorStat) -> List[str]:
     """Convert a single :class:`MotorStat` to a CSV row (34 cells)."""
-    return [
-        stat.record_date,
-        _fmt_optional(stat.motor_period_start),
-        _fmt_optional(stat.stadium_code),
-        _fmt_optional(stat.motor_number),
-        _fmt_optional(stat.win_rate),
-        _fmt_optional(stat.win_rate_rank),
-        _fmt_optional(stat.double_rate),
-        _fmt_optional(stat.double_rate_rank),
-        _fmt_optional(stat.triple_rate),
-        _fmt_optional(stat.triple_rate_rank),
-        _fmt_optional(stat.first_count),
-        _fmt_optional(stat.first_rank),
-        _fmt_optional(stat.second_count),
-        _fmt_optional(stat.second_rank),
-        _fmt_optional(stat.third_count),
-        _fmt_optional(stat.third_rank),
-        _fmt_optional(stat.out_of_place_count),
-        _fmt_optional(stat.start_count),
-        _fmt_optional(stat.championship_count),
-        _fmt_optional(stat.championship_rank),
-        _fmt_optional(stat.final_count),
-        _fmt_optional(stat.final_rank),
-        _fmt_optional(stat.raw_col_21),
-        _fmt_optional(stat.raw_col_22),
-        _fmt_optional(stat.avg_lap_seconds),
-        _fmt_optional(stat.avg_lap_rank),
-        _fmt_optional(stat.first_use_date),
-        _fmt_optional(stat.maintenance_type1_count),
-        _fmt_optional(stat.maintenance_type2_count),
-        _fmt_optional(stat.maintenance_type3_count),
-        _fmt_optional(stat.maintenance_type4_count),
-        _fmt_optional(stat.maintenance_type5_count),
-        _fmt_optional(stat.maintenance_type6_count),
-        _fmt_optional(stat.last_maintenance_date),
-    ]
+    return _fmt_cells(_MOTOR_STAT_ATTRS(stat))
 
 
 def motor_stats_to_csv(items: List[MotorStat]) -> str:
@@ -884,10 +968,6 @@ def motor_stats_to_csv(items: List[MotorStat]) -> str:
     failure.
     """
     try:
-        output = StringIO()
-        writer = csv.writer(output, lineterminator="\n")
-        writer.writerow(MOTOR_STATS_HEADERS)
-
         ordered = sorted(
             items,
             key=lambda s: (
@@ -895,17 +975,9 @@ def motor_stats_to_csv(items: List[MotorStat]) -> str:
                 s.motor_number if s.motor_number is not None else 0,
             ),
         )
-        for item in ordered:
-            writer.writerow(motor_stat_to_row(item))
-
-        csv_content = output.getvalue()
-        output.close()
-
-        logging_module.info(
-            "csv_generated",
-            file_type="motor_stats",
-            rows=len(ordered) + 1,
-            size_bytes=len(csv_content.encode("utf-8")),
+        csv_content = _join_csv_lines(
+            "motor_stats",
+            iter_csv_text(MOTOR_STATS_HEADERS, map(motor_stat_to_row, ordered)),
         )
         return csv_content
 
@@ -941,16 +1013,19 @@ MOTOR_HISTORY_HEADERS: List[str] = [
 ]
 
 
+_MOTOR_HISTORY_ATTRS = operator.attrgetter(
+    "stadium_code",
+    "session_end_key",
+    "motor_number",
+    "start_date",
+    "end_date",
+    "grade",
+    "title",
+    "racer_name",
+    "finish_sequence",
+)
+
+
 def motor_history_entry_to_row(entry: MotorHistoryEntry) -> List[str]:
     """Convert a single :class:`MotorHistoryEntry` to a CSV row (9 cells)."""
-    return [
-        entry.stadium_code,
-        entry.session_end_key,
-        _fmt_optional(entry.motor_number),
-        _fmt_optional(entry.start_date),
-        _fmt_optional(entry.end_date),
-        _fmt_optional(entry.grade),
-        _fmt_optional(entry.title),
-        _fmt_optional(entry.racer_name),
-        _fmt_optional(entry.finish_sequence),
-    ]
+    return _fmt_cells(_MOTOR_HISTORY_ATTRS(entry))
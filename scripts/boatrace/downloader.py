@@ -1,10 +1,19 @@
 """Download K-files and B-files from boatrace official server."""
 
+import threading
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, Tuple
 from . import logger as logging_module
 
+# K/B archive URL, filled with (kind, YYYY, MM, prefix, YY, MM, DD)
+_ARCHIVE_URL = "https://www1.mbrace.or.jp/od2/%s/%s%s/%s%s%s%s.lzh"
+
+# Keep-alive session shared by download_file calls (created on first use)
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
 
 class DownloadError(Exception):
     """Download operation failed."""
@@ -65,6 +74,33 @@ class ExponentialBackoff:
         self.current_attempt += 1
 
 
+def _get_session() -> requests.Session:
+    """Return the shared download session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                session.headers["Connection"] = "keep-alive"
+                # Retries are driven by ExponentialBackoff in download_file.
+                adapter = HTTPAdapter(
+                    pool_connections=4, pool_maxsize=16, max_retries=0
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _SESSION = session
+    return _SESSION
+
+
+def close_session() -> None:
+    """Close the shared download session and release pooled connections."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            _SESSION.close()
+            _SESSION = None
+
+
 def download_file(
     url: str,
     max_retries: int = 3,
@@ -85,6 +121,7 @@ def download_file(
     if rate_limiter is None:
         rate_limiter = RateLimiter()
 
+    session = _get_session()
     backoff = ExponentialBackoff()
     last_error: Optional[Exception] = None
     last_status_code: int = 0
@@ -101,17 +138,18 @@ def download_file(
             rate_limiter.wait()
 
             # Make request
-            response = requests.get(url, timeout=timeout_seconds)
+            response = session.get(url, timeout=timeout_seconds)
             last_status_code = response.status_code
 
             if response.status_code == 200:
+                content = response.content
                 logging_module.info(
                     "download_success",
                     url=url,
-                    size_bytes=len(response.content),
+                    size_bytes=len(content),
                     attempt=attempt + 1,
                 )
-                return response.content, 200
+                return content, 200
 
             elif response.status_code == 404:
                 # Not found - don't retry
@@ -223,17 +261,9 @@ def download_boatrace_files(
 
     # Convert date to K-file and B-file format
     # e.g., 2025-12-01 -> https://www1.mbrace.or.jp/od2/K/202512/k251201.lzh
-    date_parts = date.split("-")
-    year = date_parts[0]  # Full year (YYYY)
-    month = date_parts[1]  # Month (MM)
-    day = date_parts[2]  # Day (DD)
-    year_short = year[2:]  # Last 2 digits of year (YY)
-    file_date = f"{year_short}{month}{day}"
-    year_month = f"{year}{month}"  # YYYYMM format
-
-    base_url = "https://www1.mbrace.or.jp/od2"
-    k_file_url = f"{base_url}/K/{year_month}/k{file_date}.lzh"
-    b_file_url = f"{base_url}/B/{year_month}/b{file_date}.lzh"
+    year, month, day = date.split("-")  # YYYY, MM, DD
+    k_file_url = _ARCHIVE_URL % ("K", year, month, "k", year[2:], month, day)
+    b_file_url = _ARCHIVE_URL % ("B", year, month, "b", year[2:], month, day)
 
     # Download K-file
     k_content, k_status = download_file(
@@ -17,11 +17,16 @@ class ExtractionError(Exception):
     pass
 
 
-def extract_lzh(lzh_bytes: bytes) -> Optional[Dict[str, str]]:
+def extract_lzh(
+    lzh_bytes: bytes,
+    filter_prefix: Optional[str] = None,
+) -> Optional[Dict[str, str]]:
     """Extract LZH file and return contents.
 
     Args:
         lzh_bytes: LZH file content as bytes
+        filter_prefix: Only read members whose filename starts with this
+            prefix; other members are skipped without decompression
 
     Returns:
         Dictionary of {filename: text_content} or None on failure
@@ -38,12 +43,18 @@ def extract_lzh(lzh_bytes: bytes) -> Optional[Dict[str, str]]:
         lzh_file = BytesIO(lzh_bytes)
         lha = lhafile.LhaFile(lzh_file)
         result = {}
+        skipped = []  # members left out by filter_prefix
+        matched = False
 
         # Extract each file
         for item in lha.infolist():
             # Skip directories
             if item.filename.endswith("/"):
                 continue
+            if filter_prefix and not item.filename.startswith(filter_prefix):
+                skipped.append(item.filename)
+                continue
+            matched = True
 
             try:
                 # Read file content
@@ -55,11 +66,12 @@ def extract_lzh(lzh_bytes: bytes) -> Optional[Dict[str, str]]:
 
                 result[item.filename] = text_content
 
-                logging_module.debug(
-                    "file_extracted",
-                    filename=item.filename,
-                    size_bytes=len(file_content),
-                )
+                if logging_module.is_enabled_for("DEBUG"):
+                    logging_module.debug(
+                        "file_extracted",
+                        filename=item.filename,
+                        size_bytes=len(file_content),
+                    )
 
             except UnicodeDecodeError as e:
                 logging_module.warning(
@@ -74,6 +86,15 @@ def extract_lzh(lzh_bytes: bytes) -> Optional[Dict[str, str]]:
                     error=str(e),
                 )
 
+        if not matched and skipped:
+            # Nothing matched the filter: report what the archive did hold
+            logging_module.error(
+                "extraction_no_match",
+                filter_prefix=filter_prefix,
+                available_files=skipped,
+            )
+            return None
+
         if not result:
             logging_module.error(
                 "extraction_empty",
@@ -118,7 +139,7 @@ def extract_b_file(lzh_bytes: bytes) -> Optional[str]:
         DeprecationWarning,
         stacklevel=2,
     )
-    files = extract_lzh(lzh_bytes)
+    files = extract_lzh(lzh_bytes, filter_prefix="B")
     if not files:
         return None
 
@@ -5,6 +5,10 @@ from pathlib import Path
 from typing import List, Optional
 from . import logger as logging_module
 
+# Project root (parent of scripts directory); git commands run here so they
+# work correctly regardless of where the script is run from
+_PROJECT_ROOT = str(Path(__file__).resolve().parents[2])
+
 
 class GitError(Exception):
     """Git operation failed."""
@@ -98,15 +102,13 @@ def stage_files(files: List[str]) -> bool:
         return True
 
     try:
-        # Get the project root (parent of scripts directory)
-        # This ensures git commands work correctly regardless of where the script is run from
-        project_root = Path(__file__).parent.parent.parent
-        
+        # Discard stdout; keep stderr only for the failure message
         subprocess.run(
-            ["git", "add"] + files,
-            capture_output=True,
+            ["git", "add", *files],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             check=True,
-            cwd=str(project_root),
+            cwd=_PROJECT_ROOT,
         )
 
         logging_module.debug(
@@ -141,15 +143,12 @@ def commit(message: str) -> Optional[str]:
         Commit hash if successful, None otherwise
     """
     try:
-        # Get the project root
-        project_root = Path(__file__).parent.parent.parent
-        
         result = subprocess.run(
             ["git", "commit", "-m", message],
             capture_output=True,
             text=True,
             check=False,
-            cwd=str(project_root),
+            cwd=_PROJECT_ROOT,
         )
 
         if result.returncode == 0:
@@ -205,25 +204,14 @@ def push(branch: str = "main", force: bool = False) -> bool:
         True if successful, False otherwise
     """
     try:
-        # Get the project root
-        project_root = Path(__file__).parent.parent.parent
-        
-        # Fetch latest remote changes
-        fetch_result = subprocess.run(
-            ["git", "fetch", "origin", branch],
-            capture_output=True,
-            text=True,
-            check=False,
-            cwd=str(project_root),
-        )
-        
-        # Rebase local commits on top of remote
+        # Fetch latest remote changes and rebase local commits on top
+        # (one process instead of separate fetch + rebase)
         rebase_result = subprocess.run(
-            ["git", "rebase", f"origin/{branch}"],
+            ["git", "pull", "--rebase", "origin", branch],
             capture_output=True,
             text=True,
             check=False,
-            cwd=str(project_root),
+            cwd=_PROJECT_ROOT,
         )
         
         if rebase_result.returncode != 0:
@@ -243,7 +231,7 @@ def push(branch: str = "main", force: bool = False) -> bool:
             capture_output=True,
             text=True,
             check=False,
-            cwd=str(project_root),
+            cwd=_PROJECT_ROOT,
         )
 
         if result.returncode == 0:
@@ -1,10 +1,46 @@
 """Structured JSON logging for boatrace data automation."""
 
+import atexit
 import json
 import sys
-from datetime import datetime
+import time
+import weakref
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, TextIO
+
+# Numeric log levels (same values as StructuredLogger.level_values)
+_DEBUG = 10
+_INFO = 20
+_WARNING = 30
+_ERROR = 40
+_CRITICAL = 50
+
+# [epoch second, UTC "YYYY-MM-DDTHH:MM:SS", local date "YYYY-MM-DD"]
+# Records within the same second reuse the formatted strings
+_TS_CACHE: list = [-1, "", ""]
+
+
+# Loggers holding an open log file. Weak references, so the exit hook
+# below closes them without keeping replaced loggers alive.
+_OPEN_LOGGERS: "weakref.WeakSet[StructuredLogger]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_loggers() -> None:
+    """Close every log file still open at interpreter exit."""
+    for logger in list(_OPEN_LOGGERS):
+        logger.close()
+
+
+def _now() -> float:
+    """Return ``time.time()``, refreshing the per-second string cache."""
+    now = time.time()
+    sec = int(now)
+    if sec != _TS_CACHE[0]:
+        _TS_CACHE[0] = sec
+        _TS_CACHE[1] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _TS_CACHE[2] = time.strftime("%Y-%m-%d", time.localtime(sec))
+    return now
 
 
 class StructuredLogger:
@@ -24,23 +60,35 @@ class StructuredLogger:
         self.log_level = log_level.upper()
         self.log_file = log_file
         self.level_values = {
-            "DEBUG": 10,
-            "INFO": 20,
-            "WARNING": 30,
-            "ERROR": 40,
-            "CRITICAL": 50,
+            "DEBUG": _DEBUG,
+            "INFO": _INFO,
+            "WARNING": _WARNING,
+            "ERROR": _ERROR,
+            "CRITICAL": _CRITICAL,
         }
+        # Resolve the level once; each log call is then a single int compare
+        self._threshold = self.level_values.get(self.log_level, _INFO)
+        # Dated log file kept open across records (reopened on rollover)
+        self._fh: Optional[TextIO] = None
+        self._fh_path: Optional[str] = None
 
     def _should_log(self, level: str) -> bool:
         """Check if message should be logged based on level."""
-        return self.level_values.get(level.upper(), 20) >= self.level_values.get(
-            self.log_level, 20
-        )
+        return self.level_values.get(level.upper(), _INFO) >= self._threshold
+
+    def is_enabled_for(self, level: str) -> bool:
+        """Return True if a message at ``level`` would be emitted.
+
+        Lets callers skip computing expensive log fields when the message
+        would be dropped anyway.
+        """
+        return self._should_log(level)
 
     def _format_log(self, level: str, event: str, **context: Any) -> str:
         """Format log message as JSON."""
+        micros = int((_now() % 1) * 1e6)
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": f"{_TS_CACHE[1]}.{micros:06d}Z",
             "level": level.upper(),
             "event": event,
             **context,
@@ -52,38 +100,59 @@ class StructuredLogger:
         print(log_json)
 
         if self.log_file:
-            log_path = Path(self.log_file.replace("{DATE}", datetime.now().strftime("%Y-%m-%d")))
-            log_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(log_path, "a", encoding="utf-8") as f:
-                f.write(log_json + "\n")
+            _now()
+            log_path = self.log_file.replace("{DATE}", _TS_CACHE[2])
+            if log_path != self._fh_path:
+                self._open_log_file(log_path)
+            self._fh.write(log_json + "\n")
+
+    def _open_log_file(self, log_path: str) -> None:
+        """Switch the persistent log handle to ``log_path`` (date rollover)."""
+        if self._fh is not None:
+            self._fh.close()
+        path = Path(log_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Line-buffered: each record reaches the OS as it is written, so
+        # nothing is lost when a long-running script is killed by a signal
+        self._fh = open(path, "a", encoding="utf-8", buffering=1)
+        self._fh_path = log_path
+        _OPEN_LOGGERS.add(self)
+
+    def close(self) -> None:
+        """Flush and close the log file handle, if one is open."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+            self._fh_path = None
+        _OPEN_LOGGERS.discard(self)
 
     def debug(self, event: str, **context: Any) -> None:
         """Log debug message."""
-        if self._should_log("DEBUG"):
+        if _DEBUG >= self._threshold:
             log_json = self._format_log("DEBUG", event, **context)
             self._write_log(log_json)
 
     def info(self, event: str, **context: Any) -> None:
         """Log info message."""
-        if self._should_log("INFO"):
+        if _INFO >= self._threshold:
             log_json = self._format_log("INFO", event, **context)
             self._write_log(log_json)
 
     def warning(self, event: str, **context: Any) -> None:
         """Log warning message."""
-        if self._should_log("WARNING"):
+        if _WARNING >= self._threshold:
             log_json = self._format_log("WARNING", event, **context)
             self._write_log(log_json)
 
     def error(self, event: str, **context: Any) -> None:
         """Log error message."""
-        if self._should_log("ERROR"):
+        if _ERROR >= self._threshold:
             log_json = self._format_log("ERROR", event, **context)
             self._write_log(log_json)
 
     def critical(self, event: str, **context: Any) -> None:
         """Log critical message."""
-        if self._should_log("CRITICAL"):
+        if _CRITICAL >= self._threshold:
             log_json = self._format_log("CRITICAL", event, **context)
             self._write_log(log_json)
 
@@ -98,6 +167,8 @@ def initialize_logger(
 ) -> StructuredLogger:
     """Initialize and return global logger."""
     global _logger
+    if _logger is not None:
+        _logger.close()
     _logger = StructuredLogger(log_level=log_level, log_file=log_file)
     return _logger
 
@@ -110,6 +181,11 @@ def get_logger() -> StructuredLogger:
     return _logger
 
 
+def is_enabled_for(level: str) -> bool:
+    """Check whether the global logger would emit ``level``."""
+    return get_logger().is_enabled_for(level)
+
+
 def debug(event: str, **context: Any) -> None:
     """Log debug message."""
     get_logger().debug(event, **context)
@@ -5,7 +5,7 @@ from typing import List, Optional
 from datetime import datetime, date as date_type
 
 
-@dataclass
+@dataclass(slots=True)
 class RacerFrame:
     """Racer frame data from program file."""
 
@@ -64,7 +64,7 @@ class RacerFrame:
     field_8: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RaceProgram:
     """Race program with racer frame data."""
 
@@ -97,7 +97,7 @@ class RaceProgram:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PreviewBoatInfo:
     """Preview data for a single boat."""
 
@@ -110,7 +110,7 @@ class PreviewBoatInfo:
     start_timing: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RacePreview:
     """Preview data for a single race (直前情報)."""
 
@@ -137,7 +137,7 @@ class RacePreview:
         return len(self.boats) == 6
 
 
-@dataclass
+@dataclass(slots=True)
 class OriginalExhibitionBoat:
     """Original exhibition data for a single boat (race.boatcast.jp)."""
 
@@ -150,7 +150,7 @@ class OriginalExhibitionBoat:
     value3: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OriginalExhibitionData:
     """Original exhibition data (オリジナル展示データ) for a single race.
 
@@ -186,7 +186,7 @@ class OriginalExhibitionData:
         return self.status not in ("2",)
 
 
-@dataclass
+@dataclass(slots=True)
 class RaceCardSession:
     """One slot of 節間成績 (in-series race-by-race breakdown).
 
@@ -210,7 +210,7 @@ class RaceCardSession:
     finish_position: Optional[str] = None  # 着順 ("1"-"6" / "F" / "L" / "欠" / "転" / "妨" / "落")
 
 
-@dataclass
+@dataclass(slots=True)
 class RaceCardBoat:
     """One boat's row in bc_j_str3 (出走表詳細, parallel to programs)."""
 
@@ -263,7 +263,7 @@ class RaceCardBoat:
     sessions: List[RaceCardSession] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class RaceCard:
     """Race card detail (出走表詳細) for one race, sourced from bc_j_str3."""
 
@@ -284,7 +284,7 @@ class RaceCard:
         return len(self.boats) == 6
 
 
-@dataclass
+@dataclass(slots=True)
 class Waku10Run:
     """One past race in the 枠番別過去10走 (bc_j_waku10) breakdown.
 
@@ -299,7 +299,7 @@ class Waku10Run:
     grade: Optional[str] = None  # グレード ("IP" = 一般 / "G1" / "G2" / "G3" / "SG")
 
 
-@dataclass
+@dataclass(slots=True)
 class Waku10Boat:
     """One boat's row in bc_j_waku10 (枠番別過去10走).
 
@@ -317,7 +317,7 @@ class Waku10Boat:
     runs: List[Waku10Run] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Waku10Card:
     """枠番別過去10走 data for one race, sourced from bc_j_waku10."""
 
@@ -336,7 +336,7 @@ class Waku10Card:
         return len(self.boats) == 6
 
 
-@dataclass
+@dataclass(slots=True)
 class MotorHistoryEntry:
     """One (motor, 節) usage record from ``bc_mrireki`` (モーター履歴).
 
@@ -361,7 +361,7 @@ class MotorHistoryEntry:
     finish_sequence: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleEntry:
     """One 節 (race series) in a stadium's monthly schedule (bc_mon_2)."""
 
@@ -373,7 +373,7 @@ class ScheduleEntry:
     races: Optional[str] = None  # 1日のレース数 (e.g. "12R")
 
 
-@dataclass
+@dataclass(slots=True)
 class RecentFormSession:
     """One ``節`` (race series) record of recent results.
 
@@ -395,7 +395,7 @@ class RecentFormSession:
     finish_sequence: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RecentFormBoat:
     """One boat's recent-form data within a race.
 
@@ -412,7 +412,7 @@ class RecentFormBoat:
     sessions: List[RecentFormSession] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class RecentForm:
     """Recent-form data for one race (5 most recent 節, per boat).
 
@@ -435,7 +435,7 @@ class RecentForm:
         return len(self.boats) == 6
 
 
-@dataclass
+@dataclass(slots=True)
 class MotorStat:
     """Per-motor period statistics from race.boatcast.jp's ``bc_mdc``.
 
@@ -164,10 +164,11 @@ def _numeric_cells(line: str, expected: int) -> Optional[List[str]]:
 
     Returns ``None`` when the line has fewer than *expected* cells.
     """
-    cells = [_clean(c) for c in line.split("\t")]
+    # Bounded split: cells past *expected* are never cleaned or kept.
+    cells = line.split("\t", expected)
     if len(cells) < expected:
         return None
-    return cells[:expected]
+    return [_clean(c) for c in cells[:expected]]
 
 
 def _range_cells(line: str, expected_pairs: int) -> Optional[List[str]]:
@@ -176,12 +177,13 @@ def _range_cells(line: str, expected_pairs: int) -> Optional[List[str]]:
     The wire format is ``v \\t ～ \\t v`` repeated; we keep positions 0 and 2
     of each group.
     """
-    cells = [_clean(c) for c in line.split("\t")]
+    cells = line.split("\t", expected_pairs * 3)
     if len(cells) < expected_pairs * 3:
         return None
     flat: List[str] = []
     for i in range(expected_pairs):
-        flat.extend([cells[i * 3], cells[i * 3 + 2]])
+        flat.append(_clean(cells[i * 3]))
+        flat.append(_clean(cells[i * 3 + 2]))
     return flat
 
 
@@ -67,6 +67,8 @@ def parse_program_file(content: str, date: str = "") -> List[RaceProgram]:
         stacklevel=2,
     )
     programs = []
+    # Check once so disabled DEBUG doesn't build per-race kwargs
+    debug_enabled = logging_module.is_enabled_for("DEBUG")
 
     try:
         # Clean CRLF line endings
@@ -122,11 +124,12 @@ def parse_program_file(content: str, date: str = "") -> List[RaceProgram]:
                     # This might be a title line
                     if any(ord(c) >= 0x4E00 for c in stripped):  # Has CJK characters
                         title = stripped.replace("　", "")
-                        logging_module.debug(
-                            "title_extracted",
-                            title=title,
-                            stadium=stadium,
-                        )
+                        if debug_enabled:
+                            logging_module.debug(
+                                "title_extracted",
+                                title=title,
+                                stadium=stadium,
+                            )
 
             # Parse detailed date line
             # Example: 第　５日          ２０２５年１２月　９日                  ボートレース若　松
@@ -205,15 +208,17 @@ def parse_program_file(content: str, date: str = "") -> List[RaceProgram]:
                     )
                     program_count += 1
 
-                    logging_module.debug(
-                        "program_detected",
-                        program_count=program_count,
-                        race_round=race_round_raw,
-                        stadium=stadium,
-                        title=title,
-                    )
+                    if debug_enabled:
+                        logging_module.debug(
+                            "program_detected",
+                            program_count=program_count,
+                            race_round=race_round_raw,
+                            stadium=stadium,
+                            title=title,
+                        )
                 except Exception as e:
-                    logging_module.debug("race_header_parse_failed", error=str(e))
+                    if debug_enabled:
+                        logging_module.debug("race_header_parse_failed", error=str(e))
 
                 # Skip next 3 lines (header lines)
                 for _ in range(3):
@@ -48,14 +48,15 @@ from __future__ import annotations
 import csv
 import re
 from dataclasses import dataclass, field
-from io import StringIO
 from pathlib import Path
-from typing import Iterable, List, Optional, Set
+from typing import Iterable, List, Optional, Set, Tuple
 
 import requests
 
 from . import logger as logging_module
+from .converter import iter_csv_text
 from .downloader import RateLimiter
+from .preview_csv import COMMON_HEADERS
 
 
 # ---------------------------------------------------------------------------
@@ -63,16 +64,6 @@ from .downloader import RateLimiter
 # ---------------------------------------------------------------------------
 
 
-COMMON_HEADERS: List[str] = [
-    "レースコード",
-    "レース日",
-    "レース場",
-    "レース回",
-    "締切時刻",
-    "取得日時",
-]
-
-
 def _payout_headers() -> List[str]:
     headers = list(COMMON_HEADERS)
     # 単勝 (win): boat, payout
@@ -163,15 +154,13 @@ def append_rows(
     path.parent.mkdir(parents=True, exist_ok=True)
     new_file = not path.exists() or path.stat().st_size == 0
 
-    buf = StringIO()
-    writer = csv.writer(buf, lineterminator="\n")
-    if new_file:
-        writer.writerow(headers)
-    for row in rows:
-        writer.writerow(row)
+    lines = iter_csv_text(headers, rows)
+    if not new_file:
+        next(lines)  # header already on disk
+    content = "".join(lines)
 
     with open(path, "a", encoding="utf-8") as f:
-        f.write(buf.getvalue())
+        f.write(content)
 
     logging_module.info(
         "payout_realtime_csv_appended",
@@ -508,20 +497,18 @@ def _fmt(value) -> str:
     return "" if value is None else str(value)
 
 
-def _fmt_combo(payout: Optional[Payout]) -> str:
-    return "" if payout is None else payout.combination
-
+_EMPTY_PAYOUT = ("", "", "")
 
-def _fmt_payout(payout: Optional[Payout]) -> str:
-    if payout is None or payout.payout is None:
-        return ""
-    return str(payout.payout)
 
+def _payout_cells(payout: Optional[Payout]) -> Tuple[str, str, str]:
+    """組番 / 払戻金 / 人気 cells for one payout; all blank when absent.
 
-def _fmt_popularity(payout: Optional[Payout]) -> str:
-    if payout is None or payout.popularity is None:
-        return ""
-    return str(payout.popularity)
+    One call per bet slot (rather than one per cell). 単勝 / 複勝 have no
+    人気 column and take the first two cells.
+    """
+    if payout is None:
+        return _EMPTY_PAYOUT
+    return (payout.combination, _fmt(payout.payout), _fmt(payout.popularity))
 
 
 def build_payout_row(
@@ -544,57 +531,27 @@ def build_payout_row(
         fetched_at_iso,
     ]
     # 単勝
-    row.extend([_fmt_combo(payouts.tansho), _fmt_payout(payouts.tansho)])
+    row.extend(_payout_cells(payouts.tansho)[:2])
     # 複勝 (3 slots, fill with empty strings when fewer rows)
     for i in range(3):
         f = payouts.fukusho[i] if i < len(payouts.fukusho) else None
-        row.extend([_fmt_combo(f), _fmt_payout(f)])
+        row.extend(_payout_cells(f)[:2])
     # 2連単
-    row.extend(
-        [
-            _fmt_combo(payouts.nirentan),
-            _fmt_payout(payouts.nirentan),
-            _fmt_popularity(payouts.nirentan),
-        ]
-    )
+    row.extend(_payout_cells(payouts.nirentan))
     # 2連複
-    row.extend(
-        [
-            _fmt_combo(payouts.nirenpuku),
-            _fmt_payout(payouts.nirenpuku),
-            _fmt_popularity(payouts.nirenpuku),
-        ]
-    )
+    row.extend(_payout_cells(payouts.nirenpuku))
     # 拡連複 (3 positional slots: 1-2着 / 1-3着 / 2-3着)
     for slot in payouts.kakurenfuku[:3]:
-        row.extend(
-            [
-                _fmt_combo(slot),
-                _fmt_payout(slot),
-                _fmt_popularity(slot),
-            ]
-        )
+        row.extend(_payout_cells(slot))
     # Pad to 3 slots if somehow shorter (defensive — dataclass default
     # always yields 3 entries).
     pad = 3 - min(len(payouts.kakurenfuku), 3)
     for _ in range(pad):
-        row.extend(["", "", ""])
+        row.extend(_EMPTY_PAYOUT)
     # 3連単
-    row.extend(
-        [
-            _fmt_combo(payouts.sanrentan),
-            _fmt_payout(payouts.sanrentan),
-            _fmt_popularity(payouts.sanrentan),
-        ]
-    )
+    row.extend(_payout_cells(payouts.sanrentan))
     # 3連複
-    row.extend(
-        [
-            _fmt_combo(payouts.sanrenpuku),
-            _fmt_payout(payouts.sanrenpuku),
-            _fmt_popularity(payouts.sanrenpuku),
-        ]
-    )
+    row.extend(_payout_cells(payouts.sanrenpuku))
     return row
 
 
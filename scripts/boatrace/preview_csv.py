@@ -25,11 +25,12 @@ fall inside the eligibility window for two consecutive minutes.
 from __future__ import annotations
 
 import csv
-from io import StringIO
+import operator
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Set
 
 from . import logger as logging_module
+from .converter import iter_csv_text
 
 
 # --- Common identifiers -----------------------------------------------------
@@ -46,20 +47,20 @@ COMMON_HEADERS: List[str] = [
 
 # --- Per-source headers -----------------------------------------------------
 
-TKZ_HEADERS: List[str] = list(COMMON_HEADERS) + ["状態"]
-for _n in range(1, 7):
-    TKZ_HEADERS.extend(
-        [
-            f"艇{_n}_体重(kg)",
-            f"艇{_n}_体重調整(kg)",
-            f"艇{_n}_展示タイム",
-            f"艇{_n}_チルト",
-        ]
-    )
+TKZ_HEADERS: List[str] = [
+    *COMMON_HEADERS,
+    "状態",
+    *(
+        f"艇{n}_{field}"
+        for n in range(1, 7)
+        for field in ("体重(kg)", "体重調整(kg)", "展示タイム", "チルト")
+    ),
+]
 
-STT_HEADERS: List[str] = list(COMMON_HEADERS)
-for _n in range(1, 7):
-    STT_HEADERS.extend([f"艇{_n}_コース", f"艇{_n}_スタート展示"])
+STT_HEADERS: List[str] = [
+    *COMMON_HEADERS,
+    *(f"艇{n}_{field}" for n in range(1, 7) for field in ("コース", "スタート展示")),
+]
 
 SUI_HEADERS: List[str] = list(COMMON_HEADERS) + [
     "気象観測時刻",
@@ -77,21 +78,18 @@ SUI_HEADERS: List[str] = list(COMMON_HEADERS) + [
 # leaves ``計測項目3`` and every ``艇N_値3`` blank. Realtime mode only ever
 # writes rows with status == ``"1"`` (status ``"0"`` / ``"2"`` are skipped),
 # so a status column is intentionally not present.
-OEX_HEADERS: List[str] = list(COMMON_HEADERS) + [
+OEX_HEADERS: List[str] = [
+    *COMMON_HEADERS,
     "計測数",
     "計測項目1",
     "計測項目2",
     "計測項目3",
+    *(
+        f"艇{n}_{field}"
+        for n in range(1, 7)
+        for field in ("選手名", "値1", "値2", "値3")
+    ),
 ]
-for _n in range(1, 7):
-    OEX_HEADERS.extend(
-        [
-            f"艇{_n}_選手名",
-            f"艇{_n}_値1",
-            f"艇{_n}_値2",
-            f"艇{_n}_値3",
-        ]
-    )
 
 
 # --- Path helpers -----------------------------------------------------------
@@ -111,6 +109,24 @@ def _fmt(value) -> str:
     return str(value)
 
 
+# Source keys / attributes in column order. Rows are filled with
+# ``row.extend(map(_fmt, ...))`` so each field is looked up once and the
+# iteration stays in C.
+_TKZ_BOAT_KEYS = ("weight", "weight_adjustment", "exhibition_time", "tilt_adjustment")
+_STT_BOAT_KEYS = ("course_number", "start_timing")
+_SUI_KEYS = (
+    "observed_at",
+    "wind_speed",
+    "wind_direction",
+    "wave_height",
+    "weather",
+    "air_temperature",
+    "water_temperature",
+)
+_OEX_BOAT_ATTRS = operator.attrgetter("racer_name", "value1", "value2", "value3")
+_OEX_EMPTY_BOAT = ("", "", "", "")
+
+
 def _common_cells(
     race_code: str,
     date_str: str,
@@ -152,14 +168,7 @@ def build_tkz_row(
     row.append(_fmt(status))
     for boat_num in range(1, 7):
         info = boats.get(boat_num) or {}
-        row.extend(
-            [
-                _fmt(info.get("weight")),
-                _fmt(info.get("weight_adjustment")),
-                _fmt(info.get("exhibition_time")),
-                _fmt(info.get("tilt_adjustment")),
-            ]
-        )
+        row.extend(map(_fmt, map(info.get, _TKZ_BOAT_KEYS)))
     return row
 
 
@@ -186,12 +195,7 @@ def build_stt_row(
     )
     for boat_num in range(1, 7):
         info = boats.get(boat_num) or {}
-        row.extend(
-            [
-                _fmt(info.get("course_number")),
-                _fmt(info.get("start_timing")),
-            ]
-        )
+        row.extend(map(_fmt, map(info.get, _STT_BOAT_KEYS)))
     return row
 
 
@@ -217,7 +221,7 @@ def build_oex_row(
         race_code, date_str, stadium_code, race_number,
         deadline_time, fetched_at_iso,
     )
-    labels = list(measure_labels) + [""] * 3
+    labels = (*measure_labels[:3], "", "", "")
     row.extend(
         [
             _fmt(measure_count),
@@ -230,16 +234,9 @@ def build_oex_row(
     for boat_num in range(1, 7):
         b = boats_by_number.get(boat_num)
         if b is None:
-            row.extend(["", "", "", ""])
+            row.extend(_OEX_EMPTY_BOAT)
         else:
-            row.extend(
-                [
-                    _fmt(b.racer_name),
-                    _fmt(b.value1),
-                    _fmt(b.value2),
-                    _fmt(b.value3),
-                ]
-            )
+            row.extend(map(_fmt, _OEX_BOAT_ATTRS(b)))
     return row
 
 
@@ -262,17 +259,7 @@ def build_sui_row(
         race_code, date_str, stadium_code, race_number,
         deadline_time, fetched_at_iso,
     )
-    row.extend(
-        [
-            _fmt(weather.get("observed_at")),
-            _fmt(weather.get("wind_speed")),
-            _fmt(weather.get("wind_direction")),
-            _fmt(weather.get("wave_height")),
-            _fmt(weather.get("weather")),
-            _fmt(weather.get("air_temperature")),
-            _fmt(weather.get("water_temperature")),
-        ]
-    )
+    row.extend(map(_fmt, map(weather.get, _SUI_KEYS)))
     return row
 
 
@@ -321,15 +308,13 @@ def append_rows(
     path.parent.mkdir(parents=True, exist_ok=True)
     new_file = not path.exists() or path.stat().st_size == 0
 
-    buf = StringIO()
-    writer = csv.writer(buf, lineterminator="\n")
-    if new_file:
-        writer.writerow(headers)
-    for row in rows:
-        writer.writerow(row)
+    lines = iter_csv_text(headers, rows)
+    if not new_file:
+        next(lines)  # header already on disk
+    content = "".join(lines)
 
     with open(path, "a", encoding="utf-8") as f:
-        f.write(buf.getvalue())
+        f.write(content)
 
     logging_module.info(
         "preview_csv_appended",
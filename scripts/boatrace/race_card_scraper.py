@@ -568,12 +568,14 @@ def _parse_session_quintuple(raw: str) -> RaceCardSession:
     cleaned = raw.strip()
     if not cleaned:
         return session
-    parts = [p.strip() for p in cleaned.split(",")]
+    # Only the first 5 fields are read; bound the split accordingly.
+    parts = cleaned.split(",", 5)
     if len(parts) < 5:
         # Defensive: treat malformed as empty.
         return session
+    parts = [p.strip() for p in parts[:5]]
     # Detect the placeholder "-,-,-,-,-" (any subset of dashes also).
-    if all(p in ("", "-") for p in parts[:5]):
+    if all(p in ("", "-") for p in parts):
         return session
 
     session.race_number = _to_int(parts[0])
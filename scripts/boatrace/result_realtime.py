@@ -24,16 +24,18 @@ fetches/parses races that aren't yet present.
 from __future__ import annotations
 
 import csv
+import operator
 import re
 from dataclasses import dataclass, field
-from io import StringIO
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Set
 
 import requests
 
 from . import logger as logging_module
+from .converter import iter_csv_text
 from .downloader import RateLimiter
+from .preview_csv import COMMON_HEADERS
 from .preview_tsv_scraper import (
     PreviewTsvScraper,
     _VALID_WEATHER_CODES,
@@ -46,16 +48,6 @@ from .preview_tsv_scraper import (
 # ---------------------------------------------------------------------------
 
 
-COMMON_HEADERS: List[str] = [
-    "レースコード",
-    "レース日",
-    "レース場",
-    "レース回",
-    "締切時刻",
-    "取得日時",
-]
-
-
 def _result_headers() -> List[str]:
     headers = list(COMMON_HEADERS)
     headers.append("結果記録時刻")  # bc_rs1_2 weather-row HHMM
@@ -155,15 +147,13 @@ def append_rows(
     path.parent.mkdir(parents=True, exist_ok=True)
     new_file = not path.exists() or path.stat().st_size == 0
 
-    buf = StringIO()
-    writer = csv.writer(buf, lineterminator="\n")
-    if new_file:
-        writer.writerow(headers)
-    for row in rows:
-        writer.writerow(row)
+    lines = iter_csv_text(headers, rows)
+    if not new_file:
+        next(lines)  # header already on disk
+    content = "".join(lines)
 
     with open(path, "a", encoding="utf-8") as f:
-        f.write(buf.getvalue())
+        f.write(content)
 
     logging_module.info(
         "result_realtime_csv_appended",
@@ -224,7 +214,7 @@ def _parse_st_value(raw: str) -> Optional[float]:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class FinishEntry:
     rank: int               # 1..6
     boat_number: int        # 1..6 (艇番)
@@ -233,7 +223,7 @@ class FinishEntry:
     kimari_te: str = ""     # only on 1st place row
 
 
-@dataclass
+@dataclass(slots=True)
 class CourseEntry:
     course_number: int      # 1..6 (進入コース)
     boat_number: Optional[int]   # 1..6 — None on rare blank rows
@@ -241,7 +231,7 @@ class CourseEntry:
     is_flying: bool         # True when the F flag is set
 
 
-@dataclass
+@dataclass(slots=True)
 class RaceWeather:
     observed_at: Optional[str] = None     # "HHMM"
     weather: Optional[int] = None
@@ -252,7 +242,7 @@ class RaceWeather:
     water_temperature: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RaceResult:
     finishes: List[FinishEntry] = field(default_factory=list)
     courses: List[CourseEntry] = field(default_factory=list)
@@ -367,6 +357,11 @@ def _parse_st_line(line: str) -> List[CourseEntry]:
     return courses
 
 
+# Finishes are put in rank order once, at parse time, so row builders and
+# other consumers never re-sort. C-level key instead of a lambda.
+_BY_RANK = operator.attrgetter("rank")
+
+
 def _parse_placement_lines(lines: List[str]) -> List[FinishEntry]:
     """Read up to 6 placement rows.
 
@@ -402,7 +397,7 @@ def _parse_placement_lines(lines: List[str]) -> List[FinishEntry]:
                 kimari_te=kimari_te,
             )
         )
-    finishes.sort(key=lambda f: f.rank)
+    finishes.sort(key=_BY_RANK)
     return finishes
 
 
@@ -584,6 +579,20 @@ class ResultRealtimeFetcher:
 # ---------------------------------------------------------------------------
 
 
+# Cell attributes in RESULT_HEADERS order; one C-level call per object.
+_FINISH_ATTRS = operator.attrgetter("boat_number", "racer_name", "race_time")
+_COURSE_ATTRS = operator.attrgetter("boat_number", "start_timing")
+_WEATHER_ATTRS = operator.attrgetter(
+    "weather",
+    "wind_direction",
+    "wind_speed",
+    "wave_height",
+    "air_temperature",
+    "water_temperature",
+)
+_EMPTY_TRIPLE = ("", "", "")
+
+
 def _fmt(value) -> str:
     return "" if value is None else str(value)
 
@@ -614,40 +623,20 @@ def build_result_row(
     for rank in range(1, 7):
         f = finishes_by_rank.get(rank)
         if f is None:
-            row.extend(["", "", ""])
+            row.extend(_EMPTY_TRIPLE)
         else:
-            row.extend(
-                [
-                    _fmt(f.boat_number),
-                    _fmt(f.racer_name),
-                    _fmt(f.race_time),
-                ]
-            )
+            row.extend(map(_fmt, _FINISH_ATTRS(f)))
 
     courses_by_num = {c.course_number: c for c in result.courses}
     for course in range(1, 7):
         c = courses_by_num.get(course)
         if c is None:
-            row.extend(["", "", ""])
+            row.extend(_EMPTY_TRIPLE)
         else:
-            row.extend(
-                [
-                    _fmt(c.boat_number),
-                    _fmt(c.start_timing),
-                    "F" if c.is_flying else "",
-                ]
-            )
+            row.extend(map(_fmt, _COURSE_ATTRS(c)))
+            row.append("F" if c.is_flying else "")
 
-    row.extend(
-        [
-            _fmt(result.weather.weather),
-            _fmt(result.weather.wind_direction),
-            _fmt(result.weather.wind_speed),
-            _fmt(result.weather.wave_height),
-            _fmt(result.weather.air_temperature),
-            _fmt(result.weather.water_temperature),
-        ]
-    )
+    row.extend(map(_fmt, _WEATHER_ATTRS(result.weather)))
     return row
 
 
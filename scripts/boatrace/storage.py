@@ -1,7 +1,8 @@
 """File I/O operations for CSV storage."""
 
+import gzip
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 from . import logger as logging_module
 
 
@@ -17,6 +18,28 @@ def write_csv(
         csv_content: CSV content (header + rows)
         force_overwrite: Whether to overwrite existing file
 
+    Returns:
+        True if write successful, False otherwise
+    """
+    return write_csv_lines(file_path, (csv_content,), force_overwrite)
+
+
+def write_csv_lines(
+    file_path: str,
+    lines: Iterable[str],
+    force_overwrite: bool = False,
+) -> bool:
+    """Stream CSV lines to file without building the whole document first.
+
+    Pairs with :func:`boatrace.converter.iter_csv_text`. A path ending in
+    ``.gz`` is gzip-compressed on the fly, so no uncompressed copy is held
+    in memory either.
+
+    Args:
+        file_path: Path to output CSV file (``.gz`` to compress)
+        lines: CSV text lines (header + rows), newline-terminated
+        force_overwrite: Whether to overwrite existing file
+
     Returns:
         True if write successful, False otherwise
     """
@@ -36,8 +59,9 @@ def write_csv(
         path.parent.mkdir(parents=True, exist_ok=True)
 
         # Write file
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(csv_content)
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "wt", encoding="utf-8") as f:
+            f.writelines(lines)
 
         # Verify file was written
         if not path.exists() or path.stat().st_size == 0:
@@ -30,7 +30,6 @@ import csv
 import json
 import sys
 from datetime import datetime, timedelta, timezone
-from io import StringIO
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
@@ -41,6 +40,7 @@ from boatrace import logger as logging_module
 from boatrace import git_operations
 from boatrace.converter import (
     MOTOR_HISTORY_HEADERS,
+    iter_csv_text,
     motor_history_entry_to_row,
     motor_stats_to_csv,
 )
@@ -275,15 +275,13 @@ def append_history_rows(path: Path, rows: List[List[str]]) -> int:
     path.parent.mkdir(parents=True, exist_ok=True)
     new_file = not path.exists() or path.stat().st_size == 0
 
-    buf = StringIO()
-    writer = csv.writer(buf, lineterminator="\n")
-    if new_file:
-        writer.writerow(MOTOR_HISTORY_HEADERS)
-    for row in rows:
-        writer.writerow(row)
+    lines = iter_csv_text(MOTOR_HISTORY_HEADERS, rows)
+    if not new_file:
+        next(lines)  # header already on disk
+    content = "".join(lines)
 
     with open(path, "a", encoding="utf-8") as f:
-        f.write(buf.getvalue())
+        f.write(content)
 
     logging_module.info(
         "motor_history_csv_appended",
@@ -0,0 +1,174 @@
+"""Unit tests for the wide-to-long helpers in :mod:`boatrace.common`."""
+
+import numpy as np
+import pandas as pd
+
+from boatrace.common import (
+    prepare_features,
+    reshape_previews,
+    reshape_programs,
+    reshape_results,
+)
+
+
+def _programs_wide():
+    return pd.DataFrame(
+        {
+            'レースコード': ['r1', 'r2'],
+            'タイトル': ['t', 't'],
+            'レース日': ['2025-12-01', '2025-12-01'],
+            'レース場': [1, 1],
+            'レース回': ['01R', '02R'],
+            '1枠_登録番号': ['4001', '4002'],
+            '1枠_勝率': [6.5, np.nan],
+            '2枠_登録番号': ['4003', '4004'],
+            '2枠_勝率': [5.0, 4.5],
+            '2枠_級別': ['A1', 'B1'],
+            'メモ': ['x', 'y'],
+        },
+        index=[10, 30],
+    )
+
+
+def test_reshape_programs_boat_major_rows_and_columns():
+    long = reshape_programs(_programs_wide())
+
+    assert list(long.columns) == [
+        'レースコード', 'レース日', 'レース場', 'レース回',
+        '登録番号', '勝率', '艇番', '級別',
+    ]
+    assert list(long['レースコード']) == ['r1', 'r2', 'r1', 'r2']
+    assert list(long['艇番']) == [1, 1, 2, 2]
+    assert list(long['登録番号']) == ['4001', '4002', '4003', '4004']
+    assert list(long.index) == [0, 1, 2, 3]
+    # Fields only later boats carry are NaN for earlier boats.
+    assert long['級別'].isna().tolist() == [True, True, False, False]
+
+
+def test_reshape_programs_dtypes():
+    long = reshape_programs(_programs_wide())
+
+    assert long['艇番'].dtype == np.int64
+    assert long['勝率'].dtype == np.float64
+    assert long['レース場'].dtype == np.int64
+    assert np.isnan(long['勝率'].iloc[1])
+
+
+def test_reshape_programs_include_title():
+    long = reshape_programs(_programs_wide(), include_title=True)
+
+    assert list(long.columns[:5]) == ['レースコード', 'タイトル', 'レース日', 'レース場', 'レース回']
+
+
+def test_reshape_programs_empty_and_no_boat_columns():
+    assert reshape_programs(pd.DataFrame()).empty
+    assert reshape_programs(None).empty
+    no_boats = pd.DataFrame({'レースコード': ['r1'], 'レース日': ['d']})
+    assert reshape_programs(no_boats).empty
+
+
+def test_reshape_previews_with_weather():
+    wide = pd.DataFrame(
+        {
+            'レースコード': ['r1'],
+            'レース日': ['d'],
+            'レース場': [3],
+            'レース回': ['01R'],
+            '風速(m)': [2.0],
+            '艇1_展示タイム': [6.71],
+            '艇3_展示タイム': [6.80],
+        }
+    )
+
+    long = reshape_previews(wide, include_weather=True)
+    assert list(long.columns) == [
+        'レースコード', 'レース日', 'レース場', 'レース回', '風速(m)', '展示タイム', '艇番',
+    ]
+    assert list(long['艇番']) == [1, 3]
+    assert list(long['展示タイム']) == [6.71, 6.80]
+
+    assert '風速(m)' not in reshape_previews(wide).columns
+    assert reshape_previews(wide[['レースコード', 'レース日']]).empty
+
+
+def test_reshape_results_race_order_and_invalid_boats():
+    wide = pd.DataFrame(
+        {
+            'レースコード': ['r1', 'r2'],
+            '1着_艇番': [3, '2'],
+            '2着_艇番': [1, None],
+            '3着_艇番': ['x', 7],
+        },
+        index=[5, 9],
+    )
+
+    long = reshape_results(wide)
+    assert list(long.columns) == ['レースコード', '艇番', '着順']
+    assert long.to_dict('list') == {
+        'レースコード': ['r1', 'r1', 'r2'],
+        '艇番': [3, 1, 2],
+        '着順': [1, 2, 1],
+    }
+
+
+def test_reshape_results_boat_cells_follow_int():
+    wide = pd.DataFrame(
+        {
+            'レースコード': ['r1', 'r2'],
+            '1着_艇番': ['2.0', 4.0],
+            '2着_艇番': [' 3', 2.7],
+            '3着_艇番': ['+5', '1e0'],
+        }
+    )
+
+    # As with int(): float-like text is skipped, real floats truncate.
+    long = reshape_results(wide)
+    assert long.to_dict('list') == {
+        'レースコード': ['r1', 'r1', 'r2', 'r2'],
+        '艇番': [3, 5, 4, 2],
+        '着順': [2, 3, 1, 2],
+    }
+
+
+def test_reshape_results_empty_cases():
+    assert reshape_results(pd.DataFrame()).empty
+    assert reshape_results(pd.DataFrame({'レースコード': ['r1']})).empty
+    assert reshape_results(pd.DataFrame({'レースコード': ['r1'], '1着_艇番': [None]})).empty
+
+
+def test_prepare_features_fill_values():
+    data = pd.DataFrame(
+        {
+            '今節_平均着順': [2.0, np.nan, 4.0],
+            '全国勝率': [6.0, np.nan, 4.0],
+            '展示順位': [np.nan, np.nan, np.nan],
+        }
+    )
+
+    X = prepare_features(data, ['今節_平均着順', '全国勝率', '展示順位'])
+
+    # Place columns fill with 3.5, others with their median (0 if all-NaN).
+    assert X['今節_平均着順'].tolist() == [2.0, 3.5, 4.0]
+    assert X['全国勝率'].tolist() == [6.0, 5.0, 4.0]
+    assert X['展示順位'].tolist() == [0.0, 0.0, 0.0]
+
+
+def test_prepare_features_coercion_and_column_order():
+    data = pd.DataFrame(
+        {
+            '全国勝率': ['6.0', 'abc', 4.0],
+            '今節_平均着順': [2.0, '-', 1.0],
+            '不要列': [1, 2, 3],
+        },
+        index=[4, 5, 6],
+    )
+
+    X = prepare_features(data, ['今節_平均着順', '欠損列', '全国勝率', '全国勝率'])
+
+    # Duplicates collapse, missing columns become 0.0, order follows the request.
+    assert list(X.columns) == ['今節_平均着順', '欠損列', '全国勝率']
+    assert list(X.index) == [4, 5, 6]
+    assert X['今節_平均着順'].tolist() == [2.0, 3.5, 1.0]
+    assert X['欠損列'].tolist() == [0.0, 0.0, 0.0]
+    assert X['全国勝率'].tolist() == [6.0, 5.0, 4.0]
+    assert (X.dtypes == np.float64).all()
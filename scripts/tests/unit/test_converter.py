@@ -0,0 +1,46 @@
+"""Unit tests for the shared CSV helpers in :mod:`boatrace.converter`."""
+
+import csv
+import io
+import json
+
+from boatrace import logger as logging_module
+from boatrace.converter import _join_csv_lines, iter_csv_text
+
+
+def test_iter_csv_text_yields_one_line_per_row():
+    lines = list(iter_csv_text(["a", "b"], [["1", "桐生"], ["2", ""]]))
+    assert lines == ["a,b\n", "1,桐生\n", "2,\n"]
+
+
+def test_iter_csv_text_matches_csv_writer_quoting():
+    rows = [["x,y", 'say "hi"', "multi\nline"]]
+    expected = io.StringIO()
+    writer = csv.writer(expected, lineterminator="\n")
+    writer.writerow(["h1", "h2", "h3"])
+    writer.writerows(rows)
+
+    assert "".join(iter_csv_text(["h1", "h2", "h3"], rows)) == expected.getvalue()
+
+
+def test_iter_csv_text_falls_back_to_csv_writer_for_special_rows():
+    rows = [["1", "a,b"], [""], ["2", None, 3]]
+    expected = io.StringIO()
+    writer = csv.writer(expected, lineterminator="\n")
+    writer.writerow(["h1", "h2"])
+    writer.writerows(rows)
+
+    assert "".join(iter_csv_text(["h1", "h2"], rows)) == expected.getvalue()
+
+
+def test_join_csv_lines_logs_rows_and_utf8_size(monkeypatch, capsys):
+    monkeypatch.setattr(logging_module, "_logger", None)
+    logging_module.initialize_logger(log_level="INFO")
+
+    content = _join_csv_lines("test", iter_csv_text(["a", "b"], [["1", "桐生"]]))
+
+    assert content == "a,b\n1,桐生\n"
+    record = json.loads(capsys.readouterr().out.strip())
+    assert record["event"] == "csv_generated"
+    assert record["rows"] == 2
+    assert record["size_bytes"] == len(content.encode("utf-8"))
@@ -0,0 +1,48 @@
+"""Unit tests for extractor module."""
+
+import json
+
+from boatrace import extractor
+
+
+class _FakeItem:
+    def __init__(self, filename):
+        self.filename = filename
+
+
+class _FakeLhaFile:
+    """Stand-in for ``lhafile.LhaFile`` holding a fixed member list."""
+
+    members = {"K251201.TXT": "１Ｒ".encode("shift-jis")}
+
+    def __init__(self, fileobj):
+        pass
+
+    def infolist(self):
+        return [_FakeItem(name) for name in self.members]
+
+    def read(self, filename):
+        return self.members[filename]
+
+
+class _FakeLhaModule:
+    LhaFile = _FakeLhaFile
+
+
+def test_extract_lzh_filter_prefix(monkeypatch, capsys):
+    """Test filter_prefix keeps matching members only."""
+    monkeypatch.setattr(extractor, "lhafile", _FakeLhaModule)
+
+    assert extractor.extract_lzh(b"", filter_prefix="K") == {"K251201.TXT": "１Ｒ"}
+
+
+def test_extract_lzh_filter_no_match_reports_members(monkeypatch, capsys):
+    """Test an unmatched filter logs the archive's members, not extraction_empty."""
+    monkeypatch.setattr(extractor, "lhafile", _FakeLhaModule)
+
+    assert extractor.extract_lzh(b"", filter_prefix="B") is None
+
+    log_entry = json.loads(capsys.readouterr().out.strip())
+    assert log_entry["event"] == "extraction_no_match"
+    assert log_entry["filter_prefix"] == "B"
+    assert log_entry["available_files"] == ["K251201.TXT"]
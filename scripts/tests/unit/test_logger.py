@@ -1,8 +1,16 @@
 """Unit tests for logger module."""
 
-import pytest
+import gc
 import json
+import os
+import signal
+import subprocess
+import sys
+import weakref
+from datetime import datetime
 from pathlib import Path
+
+import pytest
 from boatrace import logger as logging_module
 
 
@@ -88,3 +96,112 @@ def test_module_level_logging(capsys):
 
     log_entry = json.loads(captured.out.strip())
     assert log_entry["event"] == "test_event"
+
+
+def test_logger_is_enabled_for():
+    """Test level check used to skip expensive log fields."""
+    logger = logging_module.StructuredLogger(log_level="WARNING")
+
+    assert not logger.is_enabled_for("INFO")
+    assert logger.is_enabled_for("warning")
+    assert logger.is_enabled_for("ERROR")
+
+
+def test_logger_reuses_file_handle(tmp_path, capsys):
+    """Test log file handle is kept open across records."""
+    log_file = tmp_path / "logs" / "boatrace-{DATE}.json"
+    logger = logging_module.StructuredLogger(log_level="INFO", log_file=str(log_file))
+
+    logger.info("first_event")
+    handle = logger._fh
+    logger.error("second_event")
+    assert logger._fh is handle
+
+    logger.close()
+    written = next((tmp_path / "logs").glob("boatrace-*.json")).read_text(encoding="utf-8")
+    events = [json.loads(line)["event"] for line in written.splitlines()]
+    assert events == ["first_event", "second_event"]
+
+
+def test_module_level_debug_follows_global_level(monkeypatch, capsys):
+    """Test module-level debug() and is_enabled_for() track the global logger."""
+    monkeypatch.setattr(logging_module, "_logger", None)
+    logging_module.initialize_logger(log_level="INFO")
+    assert not logging_module.is_enabled_for("DEBUG")
+
+    logging_module.debug("hidden_event")
+    assert capsys.readouterr().out == ""
+
+    logging_module.initialize_logger(log_level="DEBUG")
+    assert logging_module.is_enabled_for("DEBUG")
+    logging_module.debug("shown_event")
+    assert json.loads(capsys.readouterr().out.strip())["event"] == "shown_event"
+
+
+def test_logger_timestamp_format():
+    """Test cached timestamp keeps the ISO-8601 UTC microsecond format."""
+    logger = logging_module.StructuredLogger(log_level="INFO")
+
+    timestamp = json.loads(logger._format_log("INFO", "event"))["timestamp"]
+    assert datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def test_logger_exit_hook_does_not_pin_loggers(tmp_path):
+    """Test closed or discarded loggers are not kept alive for atexit."""
+    log_file = str(tmp_path / "boatrace-{DATE}.json")
+
+    logger = logging_module.StructuredLogger(log_file=log_file)
+    logger.info("event")
+    assert logger in logging_module._OPEN_LOGGERS
+
+    logger.close()
+    assert logger not in logging_module._OPEN_LOGGERS
+
+    logger.info("reopened")
+    logging_module._close_open_loggers()
+    assert logger._fh is None
+
+    discarded = logging_module.StructuredLogger(log_file=log_file)
+    discarded.info("event")
+    ref = weakref.ref(discarded)
+    del discarded
+    gc.collect()
+    assert ref() is None
+
+
+_CHILD_LOGGER = """
+import sys, time
+from boatrace import logger as logging_module
+logger = logging_module.StructuredLogger(log_level="INFO", log_file=sys.argv[1])
+logger.info("info_event")
+logger.warning("warning_event")
+sys.stderr.write("ready\\n")
+sys.stderr.flush()
+time.sleep(60)
+"""
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs POSIX SIGTERM")
+def test_logger_records_survive_sigterm(tmp_path):
+    """Test records below ERROR reach the file even when atexit never runs."""
+    log_file = tmp_path / "boatrace-{DATE}.json"
+    scripts_dir = Path(logging_module.__file__).resolve().parents[1]
+    env = {**os.environ, "PYTHONPATH": str(scripts_dir)}
+    child = subprocess.Popen(
+        [sys.executable, "-c", _CHILD_LOGGER, str(log_file)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        env=env,
+        text=True,
+    )
+    try:
+        assert child.stderr.readline() == "ready\n"
+        child.send_signal(signal.SIGTERM)
+        assert child.wait(timeout=10) == -signal.SIGTERM
+    finally:
+        child.kill()
+        child.stderr.close()
+
+    written = next(tmp_path.glob("boatrace-*.json")).read_text(encoding="utf-8")
+    events = [json.loads(line)["event"] for line in written.splitlines()]
+    assert events == ["info_event", "warning_event"]
@@ -1,5 +1,7 @@
 """Unit tests for storage module."""
 
+import gzip
+
 import pytest
 from pathlib import Path
 from boatrace import storage
@@ -54,6 +56,28 @@ def test_write_csv_force_overwrite(tmp_path):
     assert csv_file.read_text() == new_content
 
 
+def test_write_csv_lines_streams_lines(tmp_path):
+    """Test writing an iterable of CSV lines."""
+    csv_file = tmp_path / "test.csv"
+    lines = iter(["header1,header2\n", "value1,value2\n"])
+
+    success = storage.write_csv_lines(str(csv_file), lines)
+
+    assert success
+    assert csv_file.read_text() == "header1,header2\nvalue1,value2\n"
+
+
+def test_write_csv_lines_gzip(tmp_path):
+    """Test that a .gz path is written gzip-compressed."""
+    csv_file = tmp_path / "test.csv.gz"
+
+    success = storage.write_csv_lines(str(csv_file), ["艇番,選手名\n", "1,桐生\n"])
+
+    assert success
+    with gzip.open(csv_file, "rt", encoding="utf-8") as f:
+        assert f.read() == "艇番,選手名\n1,桐生\n"
+
+
 def test_read_csv_success(tmp_path):
     """Test successful CSV read."""
     csv_file = tmp_path / "test.csv"